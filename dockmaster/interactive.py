@@ -77,7 +77,7 @@ def configure_cleanup(image_summary: Dict[str, Any]) -> Dict[str, Any]:
     print("\n--- 镜像清理配置 ---")
 
     # 计算项目镜像的总大小
-    project_images_size = sum(img["size_mb"] for img in image_summary["project_images"])
+    project_images_size = image_summary["project_total_size_mb"]
     project_images_count = len(image_summary["project_images"])
 
     print(
@@ -1,13 +1,20 @@
 """配置管理器类"""
 
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, Union, TypeVar, cast
+from typing import Any, Dict, Optional, Tuple, Type, Union, TypeVar, cast
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖，未安装时使用标准库json
+    orjson = None
+
 from ..constants import DEFAULT_PROJECT_CONFIG, DefaultProjectConfig
+from ..utils import atomic_write_bytes
 from .base_manager import BaseManager
 
 
@@ -45,6 +52,68 @@ def generate_validation_structure(config_template: Dict[str, Any]) -> Validation
     return validation_structure
 
 
+def _dump_config(config: Dict[str, Any]) -> bytes:
+    """
+    序列化配置为缩进两格的UTF-8 JSON，优先使用orjson
+
+    Args:
+        config: 配置内容
+
+    Returns:
+        bytes: JSON字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# 已解析的配置文件：绝对路径 -> (修改时间（纳秒）, 文件大小, 配置)
+_config_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _load_config_cached(config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    读取并解析配置文件，同一进程内文件未变化时直接返回缓存结果
+
+    修改时间或大小与缓存不一致时重新读取。
+    返回的字典为共享对象，调用方需要深拷贝后再修改。
+
+    Args:
+        config_file: 配置文件绝对路径
+        mtime_ns: 文件修改时间（纳秒）
+        size: 文件大小（字节）
+
+    Returns:
+        Dict[str, Any]: 解析后的配置
+    """
+    cached = _config_cache.get(config_file)
+    if cached and cached[0] == mtime_ns and cached[1] == size:
+        return cached[2]
+
+    with open(config_file, "rb") as f:
+        data = f.read()
+    config = orjson.loads(data) if orjson is not None else json.loads(data)
+    _config_cache[config_file] = (mtime_ns, size, config)
+    return config
+
+
+def _write_config(config_file: Union[str, Path], config: Dict[str, Any]) -> None:
+    """
+    原子写入配置文件，并用写入的内容更新缓存
+
+    写入后直接缓存配置，下次读取无需重新解析。
+
+    Args:
+        config_file: 配置文件路径
+        config: 配置内容
+    """
+    # 配置中可能包含仓库密码，新文件只允许所有者读写
+    config_file = atomic_write_bytes(config_file, _dump_config(config), new_file_mode=0o600)
+
+    st = os.stat(config_file)
+    _config_cache[config_file] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+
+
 class ConfigManager(BaseManager):
     """配置管理器类，用于管理项目配置"""
 
@@ -99,12 +168,14 @@ class ConfigManager(BaseManager):
         Raises:
             ConfigError: 配置加载失败时抛出
         """
-        config_file = os.path.join(self.project_dir, "config.json")
-        if not os.path.exists(config_file):
+        config_file = os.path.realpath(os.path.join(self.project_dir, "config.json"))
+        try:
+            st = os.stat(config_file)
+        except FileNotFoundError:
             raise ConfigError(f"项目配置文件不存在: {config_file}")
 
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        # 缓存中的配置为共享对象，深拷贝后再交给调用方修改
+        config = copy.deepcopy(_load_config_cached(config_file, st.st_mtime_ns, st.st_size))
 
         self.config = config
         self.validate_config()
@@ -205,9 +276,7 @@ class ConfigManager(BaseManager):
             ConfigError: 配置保存失败时抛出
         """
         try:
-            config_file = os.path.join(self.project_dir, "config.json")
-            with open(config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            _write_config(os.path.join(self.project_dir, "config.json"), self.config)
         except Exception as e:
             raise ConfigError(f"保存配置失败: {str(e)}")
 
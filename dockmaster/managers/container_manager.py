@@ -134,7 +134,7 @@ class ContainerManager(BaseManager):
                     # 如果是通过状态检查后选择重启的情况，先停止容器
                     if hasattr(self, "_is_restart") and self._is_restart:
                         logger.warning("正在停止容器...")
-                        run_command(f"docker compose -f {self.compose_file} down", shell=True)
+                        run_command(f"docker compose -f {self.compose_file} down", shell=True, stream=True)
                         success, error = self._wait_for_container_status("removed")
                         if not success:
                             raise ContainerError(error)
@@ -145,7 +145,7 @@ class ContainerManager(BaseManager):
                 pass
 
             logger.warning("启动容器...")
-            run_command(f"docker compose -f {self.compose_file} up -d", shell=True)
+            run_command(f"docker compose -f {self.compose_file} up -d", shell=True, stream=True)
 
             success, error = self._wait_for_container_status("running")
             if not success:
@@ -176,7 +176,7 @@ class ContainerManager(BaseManager):
                     raise ContainerError("未找到Docker Compose文件，请确保docker-compose.yml存在")
 
             logger.warning("停止容器...")
-            run_command(f"docker compose -f {self.compose_file} down", shell=True)
+            run_command(f"docker compose -f {self.compose_file} down", shell=True, stream=True)
 
             success, error = self._wait_for_container_status("removed")
             if not success:
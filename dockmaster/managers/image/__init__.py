@@ -9,7 +9,12 @@ from .push import ImagePusher
 from .tag import ImageTagger
 from .cleanup import ImageCleaner
 from .summary import ImageSummarizer
-from .utils import parse_image_name, convert_size_to_mb, parse_size_string
+from .utils import (
+    parse_image_name,
+    convert_size_to_mb,
+    parse_size_string,
+    parse_created_timestamp,
+)
 
 __all__ = [
     "ImageBuildError",
@@ -24,4 +29,5 @@ __all__ = [
     "parse_image_name",
     "convert_size_to_mb",
     "parse_size_string",
+    "parse_created_timestamp",
 ] 
\ No newline at end of file
@@ -31,4 +31,5 @@ class ImagesSummary(TypedDict):
     total_size: float
     actual_disk_usage: float
     repos: Dict[str, int]
-    project_images: List[ProjectImage] 
\ No newline at end of file
+    project_images: List[ProjectImage]
+    project_total_size_mb: float
\ No newline at end of file
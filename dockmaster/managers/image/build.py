@@ -1,15 +1,24 @@
 """镜像构建相关功能"""
 
+import hashlib
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import IO, Dict, List, Optional, Set, Tuple
 
 import docker
+from docker.api.build import process_dockerfile
+from docker.utils.build import exclude_paths
+from docker.utils.build import tar as build_context_tar
 from loguru import logger
 
 from .base import ImageBuildError
 from .tag import ImageTagger
 
+# 构建日志批量输出阈值：累计行数或字节数达到任一阈值即输出一次
+BUILD_LOG_BATCH_LINES = 32
+BUILD_LOG_BATCH_BYTES = 4096
+
 
 class ImageBuilder:
     """镜像构建器类"""
@@ -27,6 +36,10 @@ class ImageBuilder:
         self.project_dir = Path(project_dir) if isinstance(project_dir, str) else project_dir
         self.image_name = image_name
         self.tagger = ImageTagger(docker_client)
+        # 已验证存在的Dockerfile，避免重复检查文件系统
+        self._dockerfile_validated: Set[str] = set()
+        # 上次打包的构建上下文：(文件指纹, Dockerfile在上下文中的路径, tar文件对象)
+        self._context_cache: Optional[Tuple[str, str, IO[bytes]]] = None
 
     def build(
         self, dockerfile: str = "Dockerfile", build_args: Optional[Dict[str, str]] = None
@@ -43,8 +56,10 @@ class ImageBuilder:
         """
         try:
             dockerfile_path = self.project_dir / dockerfile
-            if not dockerfile_path.exists():
-                raise ImageBuildError(f"Dockerfile不存在: {dockerfile_path}")
+            if dockerfile not in self._dockerfile_validated:
+                if not dockerfile_path.exists():
+                    raise ImageBuildError(f"Dockerfile不存在: {dockerfile_path}")
+                self._dockerfile_validated.add(dockerfile)
 
             # 生成带日期时间的标签
             timestamp_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -93,24 +108,117 @@ class ImageBuilder:
         Raises:
             ImageBuildError: 构建失败时抛出
         """
+        context, dockerfile_in_context = self._make_build_context(dockerfile_path)
         build_result = self.docker_client.api.build(
-            path=str(self.project_dir),
-            dockerfile=str(dockerfile_path),
+            fileobj=context,
+            custom_context=True,
+            dockerfile=dockerfile_in_context,
             tag=image_name,
             buildargs=build_args,
             decode=True,
             rm=True,
         )
 
-        # 处理构建输出
+        # 处理构建输出，stream行攒批后合并为一次日志调用，减少日志锁竞争和格式化开销
+        batch: List[str] = []
+        batch_bytes = 0
+
+        def flush() -> None:
+            nonlocal batch_bytes
+            if batch:
+                logger.warning("\n".join(batch))
+                batch.clear()
+                batch_bytes = 0
+
         for line in build_result:
             if "stream" in line:
                 log_line = line["stream"].strip()
                 if log_line:
-                    logger.warning(log_line)
+                    batch.append(log_line)
+                    batch_bytes += len(log_line)
+                    if len(batch) >= BUILD_LOG_BATCH_LINES or batch_bytes >= BUILD_LOG_BATCH_BYTES:
+                        flush()
             elif "error" in line:
+                flush()
                 raise ImageBuildError(line["error"])
             elif "status" in line:
+                flush()
                 logger.warning(line["status"])
 
-        return True 
\ No newline at end of file
+        flush()
+        return True
+
+    def _make_build_context(self, dockerfile_path: Path) -> Tuple[IO[bytes], str]:
+        """
+        打包遵循.dockerignore规则的构建上下文，文件未变化时复用上次的tar包
+
+        Args:
+            dockerfile_path: Dockerfile路径
+
+        Returns:
+            Tuple[IO[bytes], str]: (构建上下文tar文件对象, Dockerfile在上下文中的路径)
+        """
+        context_dir = str(self.project_dir)
+        dockerfile = process_dockerfile(str(dockerfile_path), context_dir)
+        exclude = self._read_dockerignore()
+        fingerprint = self._context_fingerprint(context_dir, exclude, dockerfile)
+
+        if self._context_cache and self._context_cache[0] == fingerprint:
+            _, dockerfile_in_context, context = self._context_cache
+            logger.info("构建上下文未变化，复用上次打包结果")
+            context.seek(0)
+            return context, dockerfile_in_context
+
+        if self._context_cache:
+            self._context_cache[2].close()
+            self._context_cache = None
+
+        context = build_context_tar(context_dir, exclude=exclude, dockerfile=dockerfile, gzip=False)
+
+        # 输出上下文大小，便于发现需要补充.dockerignore的大目录
+        context.seek(0, 2)
+        logger.info(f"构建上下文大小: {context.tell() / (1024 * 1024):.2f} MB")
+        context.seek(0)
+
+        self._context_cache = (fingerprint, dockerfile[0], context)
+        return context, dockerfile[0]
+
+    @staticmethod
+    def _context_fingerprint(
+        context_dir: str, exclude: List[str], dockerfile: Tuple[str, Optional[str]]
+    ) -> str:
+        """
+        根据上下文内文件的路径、修改时间和大小计算指纹，只做stat不读取文件内容
+
+        Args:
+            context_dir: 构建上下文目录
+            exclude: 排除规则
+            dockerfile: process_dockerfile返回的(路径, 上下文外Dockerfile内容)
+
+        Returns:
+            str: 构建上下文指纹
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((exclude, dockerfile)).encode())
+        for rel_path in sorted(exclude_paths(context_dir, exclude, dockerfile=dockerfile[0])):
+            st = os.lstat(os.path.join(context_dir, rel_path))
+            digest.update(f"{rel_path}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_mode}\n".encode())
+        return digest.hexdigest()
+
+    def _read_dockerignore(self) -> List[str]:
+        """
+        读取项目目录下的.dockerignore规则
+
+        Returns:
+            List[str]: 排除规则列表，文件不存在时返回空列表
+        """
+        dockerignore = self.project_dir / ".dockerignore"
+        if not dockerignore.exists():
+            return []
+
+        patterns = []
+        for line in dockerignore.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                patterns.append(line)
+        return patterns
@@ -1,117 +1,38 @@
 """镜像清理相关功能"""
 
+import heapq
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Protocol, Tuple, TypedDict, cast
-
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import docker
+import requests
 from loguru import logger
 
 from .base import ImageBuildError
-from .utils import parse_image_name
-
-
-class CleanupStrategy(Protocol):
-    """清理策略协议"""
-
-    def filter_images(
-        self, repo_images: List[Dict], latest_image_id: Optional[str]
-    ) -> Tuple[List[str], List[str]]:
-        """筛选要删除和保留的镜像"""
-        ...
+from .utils import parse_created_timestamp, parse_image_name
 
+# 并发删除镜像的最大线程数
+MAX_DELETE_WORKERS = 8
 
-class TimeBasedCleanupStrategy:
-    """基于时间的清理策略"""
+# 时间戳格式的镜像标签，例如 20240101_120000
+TS_TAG_RE = re.compile(r"^\d{8}_\d{6}$")
 
-    def __init__(self, keep_days: int):
-        """
-        初始化时间清理策略
-
-        Args:
-            keep_days: 保留最近几天的镜像
-        """
-        self.keep_days = keep_days
 
-    def filter_images(
-        self, repo_images: List[Dict], latest_image_id: Optional[str]
-    ) -> Tuple[List[str], List[str]]:
-        """
-        筛选要删除和保留的镜像
-
-        Args:
-            repo_images: 仓库镜像列表
-            latest_image_id: latest标签的镜像ID，如果需要保留
-
-        Returns:
-            Tuple[List[str], List[str]]: (要删除的镜像, 要保留的镜像)
-        """
-        to_delete = []
-        to_keep = []
-        
-        # 计算截止日期
-        cutoff_date = datetime.now() - timedelta(days=self.keep_days)
-        cutoff_date_str = cutoff_date.strftime("%Y-%m-%dT%H:%M:%S")
-
-        for img in repo_images:
-            # 如果是latest且需要保留，则跳过
-            if latest_image_id and img["id"] == latest_image_id:
-                continue
-
-            # 检查是否是时间戳格式的标签
-            if re.match(r"^\d{8}_\d{6}$", img["tag"]):
-                if img["created"] < cutoff_date_str:
-                    to_delete.append(img["full_tag"])
-                else:
-                    to_keep.append(img["full_tag"])
-        
-        return to_delete, to_keep
-
-
-class CountBasedCleanupStrategy:
-    """基于数量的清理策略"""
-
-    def __init__(self, keep_count: int):
-        """
-        初始化数量清理策略
-
-        Args:
-            keep_count: 为每个仓库保留的最新镜像数量
-        """
-        self.keep_count = keep_count
-
-    def filter_images(
-        self, repo_images: List[Dict], latest_image_id: Optional[str]
-    ) -> Tuple[List[str], List[str]]:
-        """
-        筛选要删除和保留的镜像
+class ImgRec(NamedTuple):
+    """清理分析使用的轻量镜像记录"""
 
-        Args:
-            repo_images: 仓库镜像列表
-            latest_image_id: latest标签的镜像ID，如果需要保留
+    id: str
+    tag: str
+    full_tag: str
+    created_ts: float
 
-        Returns:
-            Tuple[List[str], List[str]]: (要删除的镜像, 要保留的镜像)
-        """
-        to_delete = []
-        to_keep = []
-        
-        # 过滤出时间戳格式的标签
-        timestamp_images = [
-            img for img in repo_images if re.match(r"^\d{8}_\d{6}$", img["tag"])
-        ]
-
-        # 保留指定数量的最新镜像
-        for i, img in enumerate(timestamp_images):
-            # 如果是latest且需要保留，则跳过
-            if latest_image_id and img["id"] == latest_image_id:
-                continue
 
-            if i < self.keep_count:
-                to_keep.append(img["full_tag"])
-            else:
-                to_delete.append(img["full_tag"])
-        
-        return to_delete, to_keep
+# 保留规则：输入某仓库的时间戳标签镜像，返回需要保留的完整标签集合
+KeepSelector = Callable[[List[ImgRec]], Set[str]]
 
 
 class ImageCleaner:
@@ -127,6 +48,8 @@ class ImageCleaner:
         """
         self.docker_client = docker_client
         self.image_name = image_name
+        # 当前项目的仓库名前缀，镜像名称变更时组件会被重新创建，这里只解析一次
+        self._repo_prefix, _ = parse_image_name(image_name)
 
     def cleanup(
         self,
@@ -134,6 +57,7 @@ class ImageCleaner:
         keep_days: Optional[int] = None,
         keep_count: Optional[int] = None,
         dry_run: bool = False,
+        all_images: Optional[List] = None,
     ) -> Tuple[List[str], List[str]]:
         """
         清理旧镜像
@@ -143,6 +67,7 @@ class ImageCleaner:
             keep_days: 保留最近几天的镜像
             keep_count: 为每个仓库保留的最新镜像数量
             dry_run: 是否只显示将要删除的镜像，不实际删除
+            all_images: 已获取的镜像列表，为None时从Docker查询当前项目的镜像
 
         Returns:
             Tuple[List[str], List[str]]: (已删除的镜像ID列表, 保留的镜像ID列表)
@@ -151,26 +76,25 @@ class ImageCleaner:
             ImageBuildError: 清理失败时抛出
         """
         try:
-            # 创建清理策略
-            strategy = None
-            if keep_days is not None:
-                strategy = TimeBasedCleanupStrategy(keep_days)
-            elif keep_count is not None:
-                strategy = CountBasedCleanupStrategy(keep_count)
-            else:
+            # 根据清理参数构建保留规则（每次清理只构建一次）
+            keep_selector = self._build_keep_selector(keep_days, keep_count)
+            if keep_selector is None:
                 # 如果没有提供策略，默认保留所有镜像
                 logger.warning("未指定清理策略，将保留所有镜像")
                 return [], []
 
-            # 获取所有镜像
-            all_images = self.docker_client.images.list()
+            # 获取镜像，自行查询时由Docker服务端按仓库名前缀过滤，只返回当前项目的镜像
+            if all_images is None:
+                all_images = self.docker_client.images.list(
+                    filters={"reference": f"{self._repo_prefix}*"}
+                )
 
             # 按仓库分组
             repo_images = self._group_images_by_repo(all_images)
 
             # 分析需要删除的镜像
             to_delete, to_keep = self._analyze_images_to_delete(
-                repo_images, keep_latest, strategy
+                repo_images, keep_latest, keep_selector
             )
 
             # 如果是dry run，只返回结果不删除
@@ -188,7 +112,7 @@ class ImageCleaner:
 
     def _group_images_by_repo(
         self, all_images: List
-    ) -> Dict[str, List[Dict]]:
+    ) -> Dict[str, List[ImgRec]]:
         """
         按仓库名分组镜像
 
@@ -196,35 +120,58 @@ class ImageCleaner:
             all_images: 所有镜像列表
 
         Returns:
-            Dict[str, List[Dict]]: 按仓库分组的镜像
+            Dict[str, List[ImgRec]]: 按仓库分组的镜像
         """
-        repo_images = {}
+        repo_images: Dict[str, List[ImgRec]] = defaultdict(list)
         for image in all_images:
+            # 创建时间只解析一次，存为Unix时间戳便于数值比较
+            created_ts = parse_created_timestamp(image.attrs["Created"])
             for tag in image.tags:
-                if ":" in tag:
-                    repo, tag_name = tag.split(":", 1)
-                    if repo not in repo_images:
-                        repo_images[repo] = []
-                    repo_images[repo].append(
-                        {
-                            "id": image.id,
-                            "tag": tag_name,
-                            "full_tag": tag,
-                            "created": image.attrs["Created"],
-                        }
-                    )
-        
-        # 对每个仓库的镜像按创建时间排序
-        for repo in repo_images:
-            repo_images[repo].sort(key=lambda x: x["created"], reverse=True)
+                repo, sep, tag_name = tag.rpartition(":")
+                if sep:
+                    repo_images[repo].append(ImgRec(image.id, tag_name, tag, created_ts))
         
         return repo_images
 
+    @staticmethod
+    def _build_keep_selector(
+        keep_days: Optional[int], keep_count: Optional[int]
+    ) -> Optional[KeepSelector]:
+        """
+        构建保留规则
+
+        Args:
+            keep_days: 保留最近几天的镜像
+            keep_count: 为每个仓库保留的最新镜像数量
+
+        Returns:
+            Optional[KeepSelector]: 保留规则，未指定任何策略时返回None
+        """
+        if keep_days is not None:
+            # 截止时间只计算一次
+            cutoff_ts = time.time() - keep_days * 86400
+
+            def select_by_time(timestamp_images: List[ImgRec]) -> Set[str]:
+                return {img.full_tag for img in timestamp_images if img.created_ts >= cutoff_ts}
+
+            return select_by_time
+
+        if keep_count is not None:
+
+            def select_by_count(timestamp_images: List[ImgRec]) -> Set[str]:
+                # 只取最新的keep_count个镜像，无需对整个列表排序
+                kept = heapq.nlargest(keep_count, timestamp_images, key=attrgetter("created_ts"))
+                return {img.full_tag for img in kept}
+
+            return select_by_count
+
+        return None
+
     def _analyze_images_to_delete(
         self,
-        repo_images: Dict[str, List[Dict]],
+        repo_images: Dict[str, List[ImgRec]],
         keep_latest: bool,
-        strategy: CleanupStrategy,
+        keep_selector: KeepSelector,
     ) -> Tuple[List[str], List[str]]:
         """
         分析需要删除的镜像
@@ -232,7 +179,7 @@ class ImageCleaner:
         Args:
             repo_images: 按仓库分组的镜像
             keep_latest: 是否保留latest标签的镜像
-            strategy: 清理策略
+            keep_selector: 保留规则
 
         Returns:
             Tuple[List[str], List[str]]: (要删除的镜像, 要保留的镜像)
@@ -243,23 +190,31 @@ class ImageCleaner:
         # 处理每个仓库的镜像
         for repo, images in repo_images.items():
             # 如果不是当前项目的镜像，跳过
-            base_image_name, _ = parse_image_name(self.image_name)
-            if not repo.startswith(base_image_name):
+            if not repo.startswith(self._repo_prefix):
                 continue
 
-            # 标记要保留的latest镜像
-            latest_image_id = None
-            if keep_latest:
-                for img in images:
-                    if img["tag"] == "latest":
-                        latest_image_id = img["id"]
-                        to_keep.append(img["full_tag"])
-                        break
-
-            # 应用清理策略
-            delete_list, keep_list = strategy.filter_images(images, latest_image_id)
-            to_delete.extend(delete_list)
-            to_keep.extend(keep_list)
+            # 一次遍历同时找出latest镜像和时间戳格式的镜像
+            latest_ids: Set[str] = set()
+            timestamp_images = []
+            for img in images:
+                if img.tag == "latest":
+                    if keep_latest:
+                        latest_ids.add(img.id)
+                        to_keep.append(img.full_tag)
+                elif TS_TAG_RE.match(img.tag):
+                    timestamp_images.append(img)
+
+            # 应用保留规则
+            kept_tags = keep_selector(timestamp_images)
+            for img in timestamp_images:
+                # 与latest指向同一镜像且需要保留，则跳过
+                if img.id in latest_ids:
+                    continue
+
+                if img.full_tag in kept_tags:
+                    to_keep.append(img.full_tag)
+                else:
+                    to_delete.append(img.full_tag)
 
         return to_delete, to_keep
 
@@ -274,12 +229,36 @@ class ImageCleaner:
             List[str]: 已删除的镜像列表
         """
         deleted = []
-        for tag in to_delete:
-            try:
-                self.docker_client.images.remove(tag)
-                deleted.append(tag)
-                logger.info(f"已删除镜像: {tag}")
-            except Exception as e:
-                logger.error(f"删除镜像 {tag} 失败: {e}")
+        if not to_delete:
+            return deleted
+
+        # 删除操作受Docker守护进程I/O限制，使用线程池并发执行，线程数不超过待删除数量
+        max_workers = min(MAX_DELETE_WORKERS, len(to_delete))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for tag, ok in zip(to_delete, executor.map(self._safe_remove, to_delete)):
+                if ok:
+                    deleted.append(tag)
         
-        return deleted 
\ No newline at end of file
+        return deleted
+
+    def _safe_remove(self, tag: str) -> bool:
+        """
+        删除单个镜像，捕获并记录异常，单个镜像删除失败不影响其他镜像
+
+        Args:
+            tag: 要删除的镜像标签
+
+        Returns:
+            bool: 是否删除成功
+        """
+        try:
+            self.docker_client.api.remove_image(tag, force=False, noprune=False)
+            logger.info(f"已删除镜像: {tag}")
+            return True
+        except docker.errors.ImageNotFound:
+            # 待删除列表来自最近的镜像列表，期间可能已被删除
+            logger.info(f"镜像 {tag} 已不存在，跳过")
+            return False
+        except (docker.errors.APIError, requests.exceptions.RequestException) as e:
+            logger.error(f"删除镜像 {tag} 失败: {e}")
+            return False 
\ No newline at end of file
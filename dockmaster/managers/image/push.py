@@ -1,8 +1,10 @@
 """镜像推送相关功能"""
 
+import functools
+import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import docker
 from loguru import logger
@@ -12,6 +14,21 @@ from .tag import ImageTagger
 from .utils import parse_image_name
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_pw(username: str) -> Optional[str]:
+    """
+    从环境变量解析仓库密码，结果在进程内缓存
+
+    Args:
+        username: 用户名
+
+    Returns:
+        Optional[str]: 优先返回DOCKER_PASSWORD_<USERNAME>，其次DOCKER_PASSWORD
+    """
+    env_var_name = f"DOCKER_PASSWORD_{username.upper()}"
+    return os.environ.get(env_var_name) or os.environ.get("DOCKER_PASSWORD")
+
+
 class ImagePusher:
     """镜像推送器类"""
 
@@ -54,9 +71,7 @@ class ImagePusher:
             ImagePushError: 推送失败时抛出
         """
         try:
-            original_image_name = self.image_name
-
-            # 准备要推送的镜像标签
+            # 准备要推送的镜像标签（不修改self.image_name，可安全并发调用）
             images_to_push = self._prepare_image_tags(
                 registry, username, prefix, use_timestamp_tag, use_existing_tags
             )
@@ -69,26 +84,16 @@ class ImagePusher:
             self._do_login(registry, username, password)
 
             # 推送镜像
-            push_success = self._push_images(images_to_push, username)
-
-            # 恢复原始镜像名称
-            self.image_name = original_image_name
-            return push_success
+            return self._push_images(images_to_push, username)
 
         except ImagePushError as e:
             logger.error(f"推送镜像失败: {e}")
-            # 恢复原始镜像名称
-            self.image_name = original_image_name
             return False
         except docker.errors.ImageNotFound:
             logger.error(f"镜像 {self.image_name} 不存在，请先构建镜像")
-            # 恢复原始镜像名称
-            self.image_name = original_image_name
             return False
         except Exception as e:
             logger.error(f"推送镜像失败: {e}")
-            # 恢复原始镜像名称
-            self.image_name = original_image_name
             return False
 
     def _prepare_image_tags(
@@ -112,8 +117,9 @@ class ImagePusher:
         Returns:
             List[str]: 要推送的镜像标签列表
         """
-        # 解析原始镜像名称
-        repository, tag = parse_image_name(self.image_name)
+        # 解析原始镜像名称，后续只使用局部变量push_name
+        push_name = self.image_name
+        repository, tag = parse_image_name(push_name)
         
         # 确定命名空间（优先使用prefix，其次使用username）
         namespace = prefix or username
@@ -125,7 +131,7 @@ class ImagePusher:
         if use_existing_tags:
             # 这里假设当前的image_name已经是带时间戳的标签
             # 获取repository部分
-            timestamp_image_name = self.image_name
+            timestamp_image_name = push_name
             # 构造latest镜像名称
             latest_image_name = f"{repository}:latest"
         # 如果使用时间戳标签但不使用已有标签，需要创建新标签
@@ -134,51 +140,36 @@ class ImagePusher:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             timestamp_image_name = f"{repository}:{timestamp}"
             
-            # 为原始镜像添加时间戳标签
+            # 为原始镜像添加时间戳标签，直接调用低级API，无需先inspect镜像
             try:
-                image = self.docker_client.images.get(self.image_name)
-                image.tag(repository=repository, tag=timestamp)
-                logger.success(f"已为镜像 {self.image_name} 添加时间戳标签 {timestamp_image_name}")
-                
-                # 设置当前镜像名称为时间戳标签镜像
-                self.image_name = timestamp_image_name
+                self.docker_client.api.tag(
+                    push_name, repository=repository, tag=timestamp, force=True
+                )
+                logger.success(f"已为镜像 {push_name} 添加时间戳标签 {timestamp_image_name}")
             except Exception as e:
                 logger.error(f"添加时间戳标签失败: {e}")
                 return []
         
+        def apply_prefix(name: str) -> str:
+            """拼接命名空间和注册表前缀，并只为最终名称打一次标签"""
+            repo, tag_part = parse_image_name(name)
+            if namespace and "/" not in name:
+                repo = f"{namespace}/{repo}"
+            if registry and not repo.startswith(f"{registry}/"):
+                repo = f"{registry}/{repo}"
+            target = f"{repo}:{tag_part}"
+            if target == name or self.tagger.tag(name, target):
+                return target
+            return name
+
         # 处理时间戳标签和latest标签
         if timestamp_image_name:
-            # 添加命名空间和注册表前缀
-            timestamp_target = timestamp_image_name
-            if namespace:
-                timestamp_target = self.tagger.add_namespace_prefix(timestamp_target, namespace)
-            if registry:
-                timestamp_target = self.tagger.add_registry_prefix(timestamp_target, registry)
-            
-            images_to_push.append(timestamp_target)
-            
+            images_to_push.append(apply_prefix(timestamp_image_name))
             # 如果使用已有标签或时间戳标签，还需要推送latest标签
-            latest_image_name = f"{repository}:latest"
-            latest_target = latest_image_name
-            
-            # 添加命名空间和注册表前缀
-            if namespace:
-                latest_target = self.tagger.add_namespace_prefix(latest_target, namespace)
-            if registry:
-                latest_target = self.tagger.add_registry_prefix(latest_target, registry)
-            
-            images_to_push.append(latest_target)
+            images_to_push.append(apply_prefix(f"{repository}:latest"))
         else:
             # 如果不使用时间戳标签和已有标签，直接处理原始镜像名称
-            target_image = self.image_name
-            
-            # 添加命名空间和注册表前缀
-            if namespace:
-                target_image = self.tagger.add_namespace_prefix(target_image, namespace)
-            if registry:
-                target_image = self.tagger.add_registry_prefix(target_image, registry)
-            
-            images_to_push.append(target_image)
+            images_to_push.append(apply_prefix(push_name))
         
         return images_to_push
 
@@ -192,12 +183,13 @@ class ImagePusher:
         Returns:
             Optional[str]: 从环境变量获取的密码，如果未找到则返回None
         """
-        env_var_name = f"DOCKER_PASSWORD_{username.upper()}"
-        password = os.environ.get(env_var_name) or os.environ.get("DOCKER_PASSWORD")
+        password = _resolve_pw(username)
         if password:
             logger.info(f"已从环境变量获取密码")
         else:
-            logger.warning(f"未找到密码，请设置环境变量 {env_var_name} 或 DOCKER_PASSWORD")
+            logger.warning(
+                f"未找到密码，请设置环境变量 DOCKER_PASSWORD_{username.upper()} 或 DOCKER_PASSWORD"
+            )
             logger.warning(f"或者使用 'docker login -u {username}' 命令手动登录")
         return password
 
@@ -282,9 +274,13 @@ class ImagePusher:
             bool: 是否推送成功
         """
         logger.warning(f"开始推送镜像 {img_name}...")
-        push_output = []
+        saw_digest = False
         try:
-            for line in self.docker_client.images.push(img_name, stream=True, decode=True):
+            for raw in self._iter_push_lines(img_name):
+                # 绝大多数输出是层上传进度，只做字节子串判断，不解析JSON
+                if b'"error"' not in raw and b'"progress"' in raw:
+                    continue
+                line = json.loads(raw)
                 if "error" in line:
                     error_msg = line["error"]
                     logger.error(f"推送错误: {error_msg}")
@@ -308,11 +304,13 @@ class ImagePusher:
 
                     raise ImagePushError(error_msg)
                 elif "status" in line:
-                    logger.warning(line["status"])
-                    push_output.append(line["status"])
+                    status = line["status"]
+                    logger.warning(status)
+                    if not saw_digest and "digest: sha256" in status:
+                        saw_digest = True
 
             # 检查推送结果
-            if any("digest: sha256" in line for line in push_output):
+            if saw_digest:
                 logger.success(f"镜像 {img_name} 推送成功")
                 return True
             else:
@@ -320,4 +318,27 @@ class ImagePusher:
                 return False
         except docker.errors.ImageNotFound:
             logger.error(f"镜像 {img_name} 不存在，跳过推送")
-            return False 
\ No newline at end of file
+            return False
+
+    def _iter_push_lines(self, img_name: str) -> Iterator[bytes]:
+        """
+        以原始字节流推送镜像，按行切分输出
+
+        Args:
+            img_name: 镜像名称
+
+        Yields:
+            bytes: 单行JSON输出（未解码）
+        """
+        pending = b""
+        for chunk in self.docker_client.images.push(img_name, stream=True, decode=False):
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            pending += chunk
+            # 一个数据块可能包含多行，也可能只有半行，未完成的部分留到下一块
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                if raw.strip():
+                    yield raw
+        if pending.strip():
+            yield pending
@@ -1,19 +1,22 @@
 """镜像摘要信息相关功能"""
 
-import re
-import subprocess
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from loguru import logger
 
 from .base import ImagesSummary, ProjectImage
-from .utils import parse_image_name, parse_size_string
+from .utils import parse_image_name
 
 
 class ImageSummarizer:
     """镜像摘要信息管理器类"""
 
+    # Docker磁盘使用量缓存有效期（秒）
+    DISK_USAGE_CACHE_TTL: float = 60.0
+
     def __init__(self, docker_client, image_name: str):
         """
         初始化镜像摘要信息管理器
@@ -24,17 +27,30 @@ class ImageSummarizer:
         """
         self.docker_client = docker_client
         self.image_name = image_name
-
-    def get_summary(self) -> ImagesSummary:
+        # 当前项目的仓库名前缀，镜像名称变更时组件会被重新创建，这里只解析一次
+        self._repo_prefix, _ = parse_image_name(image_name)
+        # (查询时间, 磁盘使用量MB)
+        self._disk_usage_cache: Optional[Tuple[float, float]] = None
+
+    def get_summary(
+        self, all_images: Optional[Union[List, Callable[[], List]]] = None
+    ) -> ImagesSummary:
         """
         获取镜像摘要信息
 
+        Args:
+            all_images: 已获取的镜像列表，或返回镜像列表的函数（在异常处理范围内调用），
+                为None时从Docker查询
+
         Returns:
             ImagesSummary: 包含镜像总数、总大小、仓库分组等信息
         """
         try:
             # 获取所有镜像
-            all_images = self.docker_client.images.list()
+            if all_images is None:
+                all_images = self.docker_client.images.list()
+            elif callable(all_images):
+                all_images = all_images()
 
             # 初始化摘要信息
             summary = {
@@ -43,6 +59,7 @@ class ImageSummarizer:
                 "actual_disk_usage": 0,  # MB
                 "repos": {},
                 "project_images": [],
+                "project_total_size_mb": 0,  # MB
             }
 
             # 获取Docker系统信息，包含实际磁盘使用情况
@@ -61,59 +78,50 @@ class ImageSummarizer:
                 "actual_disk_usage": 0,
                 "repos": {},
                 "project_images": [],
+                "project_total_size_mb": 0,
             }
 
+    def invalidate_disk_usage_cache(self) -> None:
+        """使磁盘使用量缓存失效，在镜像构建、清理等操作后调用"""
+        self._disk_usage_cache = None
+
     def _get_docker_disk_usage(self) -> float:
         """
-        获取Docker磁盘使用情况
+        获取Docker磁盘使用情况，有效期内直接返回缓存结果
 
         Returns:
             float: Docker镜像实际占用的磁盘空间（MB）
         """
-        try:
-            # 使用docker system df命令获取实际磁盘使用情况
-            result = subprocess.run(
-                ["docker", "system", "df"], capture_output=True, text=True, check=True
-            )
-
-            # 解析输出，查找镜像行
-            lines = result.stdout.strip().split("\n")
-            for line in lines:
-                if line.startswith("Images"):
-                    # 格式通常是: Images     数量     大小     RECLAIMABLE
-                    parts = re.split(r"\s+", line.strip())
-                    if len(parts) >= 4:
-                        # 解析大小字符串（例如：5.629GB）
-                        size_str = parts[2]
-                        size_mb = parse_size_string(size_str)
-                        return round(size_mb, 2)
-
-            # 如果上面的方法失败，尝试使用docker info命令
-            result = subprocess.run(
-                ["docker", "info", "--format", "{{.Driver}}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            # 获取存储驱动类型
-            storage_driver = result.stdout.strip()
-
-            # 如果是overlay2，可以通过du命令获取实际使用量
-            if storage_driver == "overlay2":
-                result = subprocess.run(
-                    ["sudo", "du", "-sm", "/var/lib/docker/overlay2"],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    size_mb = float(result.stdout.split()[0])
-                    return round(size_mb, 2)
+        now = time.monotonic()
+        if self._disk_usage_cache and now - self._disk_usage_cache[0] < self.DISK_USAGE_CACHE_TTL:
+            return self._disk_usage_cache[1]
 
+        usage = self._query_docker_disk_usage()
+        if usage is None:
+            return 0.0
+
+        self._disk_usage_cache = (now, usage)
+        return usage
+
+    def _query_docker_disk_usage(self) -> Optional[float]:
+        """
+        从Docker守护进程查询磁盘使用情况
+
+        Returns:
+            Optional[float]: Docker镜像实际占用的磁盘空间（MB），查询失败时返回None
+        """
+        try:
+            # 直接调用Docker API（GET /system/df），避免启动docker CLI子进程或遍历overlay2目录
+            df = self.docker_client.df()
+            # LayersSize为去重后的镜像层总大小，与docker system df的Images行一致
+            layers_size = df.get("LayersSize")
+            if layers_size is None:
+                layers_size = sum(img.get("Size", 0) for img in df.get("Images") or [])
+            return round(layers_size / (1024 * 1024), 2)
         except Exception as e:
             logger.warning(f"获取Docker系统信息失败，无法计算实际磁盘使用量: {e}")
-            
-        return 0.0
+
+        return None
 
     def _process_images_info(self, all_images: List, summary: Dict) -> None:
         """
@@ -123,41 +131,41 @@ class ImageSummarizer:
             all_images: 所有镜像列表
             summary: 摘要信息字典
         """
-        # 获取当前项目的基础镜像名称
-        base_image_name, _ = parse_image_name(self.image_name)
-        
-        # 按仓库分组
-        for image in all_images:
-            # 计算大小（转换为MB）
-            # Docker镜像大小是通过image.attrs['Size']获取的，单位为字节，这里转换为MB
-            size_mb = round(image.attrs["Size"] / (1024 * 1024), 2)
-            summary["total_size"] += size_mb
+        # 总大小按字节一次性求和，最后再转换为MB
+        # Docker镜像大小是通过image.attrs['Size']获取的，单位为字节
+        total_size_bytes = sum(image.attrs["Size"] for image in all_images)
+        summary["total_size"] = round(total_size_bytes / (1024 * 1024), 2)
 
-            # 如果没有标签，跳过
-            if not image.tags:
-                continue
+        # 当前时间只取一次，用于计算所有项目镜像的创建天数
+        now = datetime.now()
 
+        # 按仓库分组
+        repo_prefix = self._repo_prefix
+        repo_counter: Counter = Counter()
+        for image in all_images:
+            size_mb = None
             for tag in image.tags:
-                if ":" in tag:
-                    repo, tag_name = tag.split(":", 1)
+                repo, sep, tag_name = tag.rpartition(":")
+                if not sep:
+                    continue
 
-                    # 更新仓库计数
-                    if repo not in summary["repos"]:
-                        summary["repos"][repo] = 0
-                    summary["repos"][repo] += 1
+                # 更新仓库计数
+                repo_counter[repo] += 1
 
-                    # 如果是当前项目的镜像，添加到项目镜像列表
-                    if repo.startswith(base_image_name):
-                        self._add_project_image(image, tag, tag_name, size_mb, summary)
+                # 只有当前项目的镜像才需要计算大小并加入项目镜像列表
+                if repo.startswith(repo_prefix):
+                    if size_mb is None:
+                        size_mb = round(image.attrs["Size"] / (1024 * 1024), 2)
+                    self._add_project_image(image, tag, tag_name, size_mb, now, summary)
+
+        summary["repos"] = dict(repo_counter)
+        summary["project_total_size_mb"] = round(summary["project_total_size_mb"], 2)
 
         # 对项目镜像按创建时间排序
         summary["project_images"].sort(key=lambda x: x["created"], reverse=True)
 
-        # 四舍五入总大小
-        summary["total_size"] = round(summary["total_size"], 2)
-
     def _add_project_image(
-        self, image, tag: str, tag_name: str, size_mb: float, summary: Dict
+        self, image, tag: str, tag_name: str, size_mb: float, now: datetime, summary: Dict
     ) -> None:
         """
         添加项目镜像到摘要
@@ -167,12 +175,12 @@ class ImageSummarizer:
             tag: 完整标签
             tag_name: 标签名称
             size_mb: 镜像大小（MB）
+            now: 当前时间
             summary: 摘要信息字典
         """
         try:
-            created_time = datetime.strptime(
-                image.attrs["Created"].split(".")[0], "%Y-%m-%dT%H:%M:%S"
-            )
+            # 只取到秒，fromisoformat比strptime快得多
+            created_time = datetime.fromisoformat(image.attrs["Created"][:19])
 
             project_image: ProjectImage = {
                 "id": image.id,
@@ -181,9 +189,11 @@ class ImageSummarizer:
                 "created": image.attrs["Created"],
                 "created_time": created_time,
                 "size_mb": size_mb,
-                "created_ago": (datetime.now() - created_time).days,
+                "created_ago": (now - created_time).days,
             }
             
             summary["project_images"].append(project_image)
+            # 顺带累计项目镜像总大小，调用方无需再遍历一次列表
+            summary["project_total_size_mb"] += size_mb
         except Exception as e:
             logger.error(f"处理项目镜像信息失败: {e}") 
\ No newline at end of file
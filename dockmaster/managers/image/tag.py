@@ -3,6 +3,7 @@
 from loguru import logger
 
 from .base import ImageBuildError
+from .utils import parse_image_name
 
 
 class ImageTagger:
@@ -17,6 +18,17 @@ class ImageTagger:
         """
         self.docker_client = docker_client
 
+    def _tag(self, source_tag: str, target_tag: str) -> None:
+        """
+        直接调用Docker标签API为镜像添加标签，无需先查询镜像对象
+
+        Args:
+            source_tag: 源镜像标签或ID
+            target_tag: 目标标签
+        """
+        repository, tag = parse_image_name(target_tag)
+        self.docker_client.api.tag(source_tag, repository=repository, tag=tag, force=True)
+
     def tag(self, source_tag: str, new_tag: str) -> bool:
         """
         为镜像添加新标签
@@ -32,12 +44,11 @@ class ImageTagger:
             ImageBuildError: 添加标签失败时抛出
         """
         try:
-            image = self.docker_client.images.get(source_tag)
-            image.tag(new_tag)
-            logger.success(f"已为镜像 {source_tag} 添加标签 {new_tag}")
+            self._tag(source_tag, new_tag)
+            logger.success("已为镜像 {} 添加标签 {}", source_tag, new_tag)
             return True
         except Exception as e:
-            logger.error(f"添加标签失败: {e}")
+            logger.error("添加标签失败: {}", e)
             return False
 
     def add_namespace_prefix(self, image_tag: str, namespace: str) -> str:
@@ -51,15 +62,15 @@ class ImageTagger:
         Returns:
             str: 添加前缀后的镜像标签
         """
+        # 已带有命名空间（或其他路径前缀）时无需重复打标签
         if namespace and "/" not in image_tag:
             target_tag = f"{namespace}/{image_tag}"
             try:
-                image = self.docker_client.images.get(image_tag)
-                image.tag(target_tag)
-                logger.success(f"已为镜像 {image_tag} 添加标签 {target_tag}")
+                self._tag(image_tag, target_tag)
+                logger.success("已为镜像 {} 添加标签 {}", image_tag, target_tag)
                 return target_tag
             except Exception as e:
-                logger.error(f"添加命名空间前缀标签失败: {e}")
+                logger.error("添加命名空间前缀标签失败: {}", e)
                 return image_tag
         return image_tag
 
@@ -74,14 +85,14 @@ class ImageTagger:
         Returns:
             str: 添加前缀后的镜像标签
         """
-        if registry:
+        # 已带有注册表前缀时无需重复打标签
+        if registry and not image_tag.startswith(f"{registry}/"):
             registry_target = f"{registry}/{image_tag}"
             try:
-                image = self.docker_client.images.get(image_tag)
-                image.tag(registry_target)
-                logger.success(f"已为镜像 {image_tag} 添加标签 {registry_target}")
+                self._tag(image_tag, registry_target)
+                logger.success("已为镜像 {} 添加标签 {}", image_tag, registry_target)
                 return registry_target
             except Exception as e:
-                logger.error(f"添加仓库前缀标签失败: {e}")
+                logger.error("添加仓库前缀标签失败: {}", e)
                 return image_tag
         return image_tag 
\ No newline at end of file
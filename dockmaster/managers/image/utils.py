@@ -1,25 +1,45 @@
 """镜像管理工具函数"""
 
+import functools
 import re
+from datetime import datetime, timezone
 from typing import Tuple, Union
 
+# 大小字符串匹配模式，只接受Docker使用的单位（B/KB/MB/GB/TB）
+_SIZE_RE = re.compile(r"([\d.]+)\s*([KMGT]?B)", re.IGNORECASE)
 
+# 各单位到MB的换算系数
+_UNIT_TO_MB = {
+    "B": 1 / (1024 * 1024),
+    "KB": 1 / 1024,
+    "MB": 1.0,
+    "GB": 1024.0,
+    "TB": 1024.0 * 1024.0,
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_image_name(image_name: str) -> Tuple[str, str]:
     """
     解析镜像名称，分离仓库名和标签
 
+    支持带端口的注册表地址（如 "registry.example.com:5000/foo:v1"）和摘要（如 "foo@sha256:..."），
+    仓库名中保留注册表地址和命名空间。
+
     Args:
-        image_name: 镜像名称，格式为 "仓库名:标签"
+        image_name: 镜像名称，格式为 "[注册表/][命名空间/]仓库名[:标签][@摘要]"
 
     Returns:
-        Tuple[str, str]: 仓库名和标签
+        Tuple[str, str]: 仓库名和标签，未指定标签时标签为 "latest"
     """
-    if ":" in image_name:
-        repository, tag = image_name.split(":", 1)
-    else:
-        repository = image_name
-        tag = "latest"
-    return repository, tag
+    # 去掉摘要部分，摘要中的冒号不是标签分隔符
+    image_name = image_name.partition("@")[0]
+
+    # 只有最后一个 "/" 之后的冒号才是标签分隔符，之前的冒号属于注册表端口
+    repository, sep, tag = image_name.rpartition(":")
+    if sep and "/" not in tag:
+        return repository, tag
+    return image_name, "latest"
 
 
 def convert_size_to_mb(size_value: float, size_unit: str) -> float:
@@ -28,23 +48,16 @@ def convert_size_to_mb(size_value: float, size_unit: str) -> float:
 
     Args:
         size_value: 大小数值
-        size_unit: 单位（GB, MB, KB, B）
+        size_unit: 单位（TB, GB, MB, KB, B，不区分大小写）
 
     Returns:
         float: 转换后的MB值
     """
-    if "GB" in size_unit:
-        return size_value * 1024
-    elif "MB" in size_unit:
-        return size_value
-    elif "KB" in size_unit:
-        return size_value / 1024
-    elif "B" in size_unit and "GB" not in size_unit and "MB" not in size_unit and "KB" not in size_unit:
-        return size_value / (1024 * 1024)
-    else:
-        return size_value
+    multiplier = _UNIT_TO_MB.get(size_unit.strip().upper())
+    return size_value * multiplier if multiplier is not None else size_value
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_size_string(size_str: str) -> float:
     """
     解析大小字符串（例如：5.629GB）为MB
@@ -55,7 +68,7 @@ def parse_size_string(size_str: str) -> float:
     Returns:
         float: 转换后的MB值
     """
-    match = re.match(r"([\d.]+)([a-zA-Z]+)", size_str)
+    match = _SIZE_RE.match(size_str)
     if match:
         size_value = float(match.group(1))
         size_unit = match.group(2)
@@ -65,4 +78,18 @@ def parse_size_string(size_str: str) -> float:
         try:
             return float(size_str)
         except ValueError:
-            return 0.0 
\ No newline at end of file
+            return 0.0 
+
+
+def parse_created_timestamp(created: str) -> float:
+    """
+    将Docker返回的Created时间（UTC，ISO格式）解析为Unix时间戳
+
+    Args:
+        created: 创建时间字符串，例如 "2024-01-01T08:00:00.123456789Z"
+
+    Returns:
+        float: Unix时间戳（秒）
+    """
+    # 只取到秒，忽略纳秒部分和时区后缀
+    return datetime.fromisoformat(created[:19]).replace(tzinfo=timezone.utc).timestamp()
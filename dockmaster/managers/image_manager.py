@@ -1,9 +1,11 @@
 """镜像管理器类 - 门面模式实现"""
 
 import os
+import time
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from loguru import logger
 
@@ -19,6 +21,9 @@ from .image.summary import ImageSummarizer
 class ImageManager(BaseManager):
     """镜像管理器类，用于构建和推送镜像"""
 
+    # 镜像列表缓存有效期（秒），用于在摘要和清理之间共享同一次查询结果
+    IMAGES_CACHE_TTL: float = 5.0
+
     def __init__(self, project_dir: str, image_name: Optional[str] = None) -> None:
         """
         初始化镜像管理器
@@ -30,14 +35,92 @@ class ImageManager(BaseManager):
         super().__init__()
         self.project_dir = Path(project_dir)
         self.image_name = image_name
-        
-        # 初始化子组件
-        self.builder = ImageBuilder(self.docker_client, self.project_dir, self.image_name) if image_name else None
-        self.pusher = ImagePusher(self.docker_client, self.image_name) if image_name else None
-        self.tagger = ImageTagger(self.docker_client)
-        self.cleaner = ImageCleaner(self.docker_client, self.image_name) if image_name else None
-        self.summarizer = ImageSummarizer(self.docker_client, self.image_name) if image_name else None
-        
+        # (查询时间, 镜像列表)
+        self._images_cache: Optional[Tuple[float, List[Any]]] = None
+
+    def _get_all_images(self) -> List[Any]:
+        """
+        获取所有镜像，短时间内重复调用时复用上一次的查询结果
+
+        Returns:
+            List[Any]: Docker镜像对象列表
+        """
+        all_images = self._peek_images_cache()
+        if all_images is not None:
+            return all_images
+
+        all_images = self.docker_client.images.list()
+        self._images_cache = (time.monotonic(), all_images)
+        return all_images
+
+    def _peek_images_cache(self) -> Optional[List[Any]]:
+        """
+        获取仍在有效期内的镜像列表缓存，不触发查询
+
+        Returns:
+            Optional[List[Any]]: 缓存的镜像列表，无缓存或已过期时返回None
+        """
+        if self._images_cache and time.monotonic() - self._images_cache[0] < self.IMAGES_CACHE_TTL:
+            return self._images_cache[1]
+        return None
+
+    def _invalidate_images_cache(self) -> None:
+        """使镜像列表缓存失效，在镜像增删或打标签后调用"""
+        self._images_cache = None
+
+    def _require_image_name(self, action: str) -> str:
+        """
+        获取当前镜像名称，未设置时抛出异常
+
+        Args:
+            action: 需要镜像名称的操作描述
+
+        Returns:
+            str: 镜像名称
+
+        Raises:
+            ValueError: 未提供image_name时抛出
+        """
+        if not self.image_name:
+            raise ValueError(f"需要提供image_name才能{action}")
+        return self.image_name
+
+    @cached_property
+    def builder(self) -> ImageBuilder:
+        """镜像构建器，首次访问时创建"""
+        return ImageBuilder(self.docker_client, self.project_dir, self._require_image_name("构建镜像"))
+
+    @cached_property
+    def pusher(self) -> ImagePusher:
+        """镜像推送器，首次访问时创建"""
+        return ImagePusher(self.docker_client, self._require_image_name("推送镜像"))
+
+    @cached_property
+    def tagger(self) -> ImageTagger:
+        """镜像标签管理器，首次访问时创建"""
+        return ImageTagger(self.docker_client)
+
+    @cached_property
+    def cleaner(self) -> ImageCleaner:
+        """镜像清理器，首次访问时创建"""
+        return ImageCleaner(self.docker_client, self._require_image_name("清理镜像"))
+
+    @cached_property
+    def summarizer(self) -> ImageSummarizer:
+        """镜像摘要信息管理器，首次访问时创建"""
+        return ImageSummarizer(self.docker_client, self._require_image_name("获取镜像摘要"))
+
+    def _rebind_components(self) -> None:
+        """镜像名称变更后使依赖image_name的子组件失效，下次访问时按新名称重新创建"""
+        for name in ("builder", "pusher", "cleaner", "summarizer"):
+            self.__dict__.pop(name, None)
+
+    def invalidate_disk_usage_cache(self) -> None:
+        """使镜像磁盘使用量缓存失效，摘要组件尚未创建时无需处理"""
+        summarizer = self.__dict__.get("summarizer")
+        if summarizer is not None:
+            summarizer.invalidate_disk_usage_cache()
+
     def get_images_summary(self) -> ImagesSummary:
         """
         获取镜像摘要信息
@@ -49,14 +132,14 @@ class ImageManager(BaseManager):
                 - actual_disk_usage: 实际磁盘使用量（MB）
                 - repos: 按仓库分组的镜像数量
                 - project_images: 当前项目的镜像列表
+                - project_total_size_mb: 当前项目镜像的总大小（MB）
 
         Raises:
             ImageBuildError: 获取镜像信息失败时抛出
         """
-        if not self.summarizer:
-            raise ValueError("需要提供image_name才能获取镜像摘要")
-        return self.summarizer.get_summary()
-        
+        # 传入查询函数而不是结果，Docker查询失败时由get_summary记录错误并返回空摘要
+        return self.summarizer.get_summary(self._get_all_images)
+
     def build_image(
         self, dockerfile: str = "Dockerfile", build_args: Optional[Dict[str, str]] = None
     ) -> bool:
@@ -70,9 +153,11 @@ class ImageManager(BaseManager):
         Returns:
             bool: 是否构建成功
         """
-        if not self.builder:
-            raise ValueError("需要提供image_name才能构建镜像")
-        return self.builder.build(dockerfile, build_args)
+        success = self.builder.build(dockerfile, build_args)
+        if success:
+            self._invalidate_images_cache()
+            self.invalidate_disk_usage_cache()
+        return success
         
     def push_image(
         self,
@@ -100,9 +185,12 @@ class ImageManager(BaseManager):
         Raises:
             ImagePushError: 推送失败时抛出
         """
-        if not self.pusher:
-            raise ValueError("需要提供image_name才能推送镜像")
-        return self.pusher.push(registry, username, password, prefix, use_timestamp_tag, use_existing_tags)
+        success = self.pusher.push(
+            registry, username, password, prefix, use_timestamp_tag, use_existing_tags
+        )
+        self._invalidate_images_cache()
+        self.invalidate_disk_usage_cache()
+        return success
                                
     def tag_image(self, source_tag: str, new_tag: str) -> bool:
         """
@@ -118,7 +206,10 @@ class ImageManager(BaseManager):
         Raises:
             ImageBuildError: 添加标签失败时抛出
         """
-        return self.tagger.tag(source_tag, new_tag)
+        success = self.tagger.tag(source_tag, new_tag)
+        if success:
+            self._invalidate_images_cache()
+        return success
         
     def cleanup_images(
         self,
@@ -142,9 +233,14 @@ class ImageManager(BaseManager):
         Raises:
             ImageBuildError: 清理失败时抛出
         """
-        if not self.cleaner:
-            raise ValueError("需要提供image_name才能清理镜像")
-        return self.cleaner.cleanup(keep_latest, keep_days, keep_count, dry_run)
+        # 刚获取过全量镜像列表时直接复用，否则由清理器按仓库名前缀只查询项目镜像
+        deleted, kept = self.cleaner.cleanup(
+            keep_latest, keep_days, keep_count, dry_run, self._peek_images_cache()
+        )
+        if deleted and not dry_run:
+            self._invalidate_images_cache()
+            self.invalidate_disk_usage_cache()
+        return deleted, kept
         
     def create_from_container(
         self, 
@@ -170,20 +266,16 @@ class ImageManager(BaseManager):
             try:
                 container = self.docker_client.containers.get(container_name)
             except Exception as e:
-                logger.error(f"获取容器 {container_name} 失败: {e}")
+                logger.error("获取容器 {} 失败: {}", container_name, e)
                 return False
 
             # 如果需要清理容器
             if cleanup:
                 logger.warning("清理容器...")
                 try:
-                    # 清理临时文件
+                    # 清理临时文件，所有路径合并为一次exec调用
                     paths = ["/tmp/*", "/var/cache/*"]
-                    for path in paths:
-                        try:
-                            container.exec_run(f"rm -rf {path}")
-                        except Exception as e:
-                            logger.error(f"清理路径 {path} 失败: {e}")
+                    container.exec_run(["sh", "-c", f"rm -rf {' '.join(paths)}"], demux=False)
                     logger.success("容器缓存清理完成")
                 except Exception as e:
                     logger.warning(f"清理容器失败: {e}，继续保存")
@@ -200,7 +292,6 @@ class ImageManager(BaseManager):
 
             # 提交容器为新镜像，添加进度提示
             logger.warning("正在提交容器状态...")
-            import time
             start_time = time.time()
 
             # 使用低级API提交容器
@@ -208,8 +299,9 @@ class ImageManager(BaseManager):
                 container=container_name, repository=repository, tag=tag
             )
 
-            # 获取新创建的镜像ID
-            image_id = response.get("Id", "").split(":")[-1][:12]
+            # 获取新创建的镜像ID，完整ID用于后续打标签，短ID用于显示
+            full_image_id = response.get("Id", "")
+            image_id = full_image_id.split(":")[-1][:12]
 
             # 计算耗时
             elapsed_time = time.time() - start_time
@@ -217,27 +309,29 @@ class ImageManager(BaseManager):
 
             # 同时设置latest标签
             latest_image_name = f"{repository}:latest"
+            logger.warning("正在设置latest标签...")
             try:
-                logger.warning("正在设置latest标签...")
-                image = self.docker_client.images.get(versioned_image_name)
-                image.tag(repository=repository, tag="latest")
-                logger.success(f"已为镜像 {versioned_image_name} 添加标签 {latest_image_name}")
+                self.docker_client.api.tag(
+                    full_image_id or versioned_image_name,
+                    repository=repository,
+                    tag="latest",
+                    force=True,
+                )
+                logger.success("已为镜像 {} 添加标签 {}", versioned_image_name, latest_image_name)
             except Exception as e:
-                logger.error(f"设置latest标签失败: {e}")
+                logger.error("设置latest标签失败: {}", e)
 
-            logger.success(f"容器已保存为镜像 {versioned_image_name}")
-            
             # 更新当前镜像名称以支持后续操作
             self.image_name = versioned_image_name
-            
-            # 重新初始化组件
-            self.builder = ImageBuilder(self.docker_client, self.project_dir, self.image_name)
-            self.pusher = ImagePusher(self.docker_client, self.image_name)
-            self.cleaner = ImageCleaner(self.docker_client, self.image_name)
-            self.summarizer = ImageSummarizer(self.docker_client, self.image_name)
-            
+
+            # 重新初始化组件，新镜像已生成，镜像列表缓存同时失效
+            self._rebind_components()
+            self._invalidate_images_cache()
+
+            logger.success("容器已保存为镜像 {}", versioned_image_name)
+
             return versioned_image_name
 
         except Exception as e:
-            logger.error(f"保存容器为镜像失败: {e}")
+            logger.error("保存容器为镜像失败: {}", e)
             return False
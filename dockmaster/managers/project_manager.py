@@ -1,9 +1,12 @@
 """项目管理器类"""
 
+import copy
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, TYPE_CHECKING
 
 from loguru import logger
 
@@ -11,6 +14,7 @@ from ..constants import DefaultProjectConfig
 from ..interactive_utils import confirm_action
 from .base_manager import BaseManager
 from .config_manager import ConfigError, ConfigManager
+from .image import ImagesSummary, parse_image_name
 from .image_manager import ImageManager
 from .container_manager import ContainerManager
 
@@ -35,6 +39,9 @@ class ProjectStatus(TypedDict):
 class ProjectManager(BaseManager):
     """项目管理器类，用于管理项目配置和资源"""
 
+    # 项目状态缓存有效期（秒），避免短时间内重复渲染状态时反复查询Docker
+    STATUS_CACHE_TTL: float = 2.0
+
     project_name: str
     project_dir: str
     config: DefaultProjectConfig
@@ -61,6 +68,8 @@ class ProjectManager(BaseManager):
 
         self.image_manager = None
         self.container_manager = None
+        # (项目状态, 查询时间)
+        self._status_cache: Optional[Tuple[ProjectStatus, float]] = None
 
         # 如果提供了配置，初始化管理器
         if config:
@@ -134,11 +143,19 @@ class ProjectManager(BaseManager):
             bool: 是否更新成功
         """
         try:
+            # 配置会被原地更新，先保存镜像和容器配置的快照用于比较
+            old_image_config = copy.deepcopy(self.config.get("image"))
+            old_container_config = copy.deepcopy(self.config.get("container"))
+
             # 更新配置
             self.config = self.config_manager.update_config(config_updates)
 
-            # 重新初始化管理器
-            self._init_managers()
+            # 只重新初始化配置发生变化的管理器
+            self._status_cache = None
+            if self.image_manager is None or old_image_config != self.config["image"]:
+                self._init_image_manager()
+            if self.container_manager is None or old_container_config != self.config["container"]:
+                self._init_container_manager()
 
             return True
 
@@ -156,22 +173,28 @@ class ProjectManager(BaseManager):
         try:
             if self.container_manager:
                 self.container_manager.cleanup_container()
+            self._status_cache = None
             return True
         except Exception as e:
             logger.error(f"清理资源失败: {e}")
             return False
 
     def _init_managers(self) -> None:
-        """初始化镜像和容器管理器"""
-        image_config = self.config["image"]
-        container_config = self.config["container"]
+        """初始化镜像和容器管理器，配置变化后项目状态缓存同时失效"""
+        self._status_cache = None
+        self._init_image_manager()
+        self._init_container_manager()
 
+    def _init_image_manager(self) -> None:
+        """根据镜像配置初始化镜像管理器"""
         self.image_manager = ImageManager(
-            project_dir=self.project_dir, image_name=image_config["name"]
+            project_dir=self.project_dir, image_name=self.config["image"]["name"]
         )
 
+    def _init_container_manager(self) -> None:
+        """根据容器配置初始化容器管理器"""
         self.container_manager = ContainerManager(
-            project_dir=self.project_dir, container_name=container_config["name"]
+            project_dir=self.project_dir, container_name=self.config["container"]["name"]
         )
 
     def get_status(self) -> ProjectStatus:
@@ -181,36 +204,34 @@ class ProjectManager(BaseManager):
         Returns:
             ProjectStatus: 项目状态信息
         """
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[1] < self.STATUS_CACHE_TTL:
+            return self._status_cache[0]
+
         try:
-            # 获取容器状态
-            container_status = "未运行"
-            try:
-                container = self.docker_client.containers.get(self.config["container"]["name"])
-                container_status = container.status
-            except Exception:
-                pass
-
-            # 获取定时任务信息
-            schedules = []
-            if "schedule" in self.config and self.config["schedule"]:
-                for task_type, task_info in self.config["schedule"].items():
-                    if task_info and "cron" in task_info:
-                        schedules.append({"type": task_type, "schedule": task_info["cron"]})
-
-            # 获取镜像摘要信息
-            image_summary = self.image_manager.get_images_summary()
-
-            # 检查镜像是否存在
-            image_exists = False
-            try:
-                self.docker_client.images.get(self.image_manager.image_name)
-                image_exists = True
-            except Exception:
-                pass
-
-            # 获取调度器状态
-            scheduler_status = self.container_manager.get_scheduler_status()
-            tasks = self.container_manager.list_scheduled_tasks()
+            # 各项查询相互独立且都受Docker守护进程I/O限制，并发执行
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                container_status_future = executor.submit(self._get_container_status)
+                image_summary_future = executor.submit(self.image_manager.get_images_summary)
+                scheduler_status_future = executor.submit(self.container_manager.get_scheduler_status)
+                tasks_future = executor.submit(self.container_manager.list_scheduled_tasks)
+
+                # 获取定时任务信息
+                schedules = []
+                if "schedule" in self.config and self.config["schedule"]:
+                    for task_type, task_info in self.config["schedule"].items():
+                        if task_info and "cron" in task_info:
+                            schedules.append({"type": task_type, "schedule": task_info["cron"]})
+
+                container_status = container_status_future.result()
+                image_summary = image_summary_future.result()
+                scheduler_status = scheduler_status_future.result()
+                tasks = tasks_future.result()
+
+            # 镜像是否存在直接从摘要中的项目镜像判断，无需再查询一次Docker
+            image_exists = self._image_exists(image_summary)
+            # 项目镜像总大小已在生成摘要时一并累加，这里只取数量和最新一个
+            project_images = image_summary["project_images"]
 
             # 构建状态信息
             status = {
@@ -219,13 +240,9 @@ class ProjectManager(BaseManager):
                     "name": self.config["image"]["name"],
                     "registry": {"url": self.config["image"]["registry"]["url"]},
                     "exists": image_exists,
-                    "backup_count": len(image_summary["project_images"]),
-                    "total_size_mb": sum(img["size_mb"] for img in image_summary["project_images"]),
-                    "latest_backup": (
-                        image_summary["project_images"][0]["created_ago"]
-                        if image_summary["project_images"]
-                        else None
-                    ),
+                    "backup_count": len(project_images),
+                    "total_size_mb": image_summary["project_total_size_mb"],
+                    "latest_backup": project_images[0]["created_ago"] if project_images else None,
                     "summary": image_summary,
                 },
                 "container": {"name": self.config["container"]["name"], "status": container_status},
@@ -234,12 +251,50 @@ class ProjectManager(BaseManager):
                 "tasks": tasks,
             }
 
+            self._status_cache = (status, now)
             return status
 
         except Exception as e:
             logger.error(f"获取项目状态失败: {e}")
             raise ProjectOperationError(f"获取项目状态失败: {str(e)}")
 
+    def _get_container_status(self) -> str:
+        """
+        获取容器状态
+
+        Returns:
+            str: 容器状态，容器不存在时返回"未运行"
+        """
+        container_name = self.config["container"]["name"]
+        try:
+            # 低级API一次列表查询即可拿到状态，无需inspect容器
+            # name过滤器是正则匹配，可能返回名称相近的容器，需要再精确比对
+            containers = self.docker_client.api.containers(
+                all=True, filters={"name": container_name}
+            )
+        except Exception:
+            return "未运行"
+
+        expected_name = f"/{container_name}"
+        for container in containers:
+            if expected_name in (container.get("Names") or []):
+                return container.get("State") or "未运行"
+        return "未运行"
+
+    def _image_exists(self, image_summary: ImagesSummary) -> bool:
+        """
+        根据镜像摘要检查项目镜像是否存在
+
+        Args:
+            image_summary: 镜像摘要信息
+
+        Returns:
+            bool: 镜像是否存在，未指定标签时检查latest标签
+        """
+        repository, tag = parse_image_name(self.image_manager.image_name)
+        full_tag = f"{repository}:{tag}"
+        return any(img["full_tag"] == full_tag for img in image_summary["project_images"])
+
     def get_config(self) -> DefaultProjectConfig:
         """
         获取项目配置
@@ -3,18 +3,58 @@
 import json
 import os
 import signal
+import threading
 import time
 import traceback
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from subprocess import check_output
-from typing import Any, Callable, Dict, Optional, TypedDict, Union, List, NoReturn
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, TypedDict, Union, List, NoReturn
 
 import daemon
 import daemon.pidfile
 import schedule
 from loguru import logger
 
+from ..utils import atomic_write_bytes
+
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖，未安装时使用标准库json
+    orjson = None
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    序列化为UTF-8编码的单行紧凑JSON，优先使用orjson
+
+    状态和历史文件只由程序读取，不缩进以减少写入量和序列化开销。
+
+    Args:
+        data: 要序列化的数据
+
+    Returns:
+        bytes: JSON字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    解析JSON字节串，优先使用orjson
+
+    Args:
+        data: JSON字节串
+
+    Returns:
+        Any: 解析结果
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class TaskHistory(TypedDict):
     """任务历史记录类型"""
@@ -41,9 +81,36 @@ class SchedulerStatus(TypedDict):
     tasks: Dict[str, TaskInfo]
 
 
+# Linux下可通过/proc判断进程是否存在，无需发送信号
+_PROC_DIR = Path("/proc")
+_HAS_PROC = _PROC_DIR.is_dir()
+
+
 class SchedulerDaemon:
     """调度器守护进程类"""
 
+    # 主循环单次休眠的最长时间（秒），没有任务时也按此间隔检查一次
+    MAX_IDLE_SECONDS: float = 60.0
+    # 主循环单次休眠的最短时间（秒），避免任务异常未能重新调度时空转
+    MIN_IDLE_SECONDS: float = 1.0
+    # 每种任务保留的历史记录条数，历史文件行数达到两倍时压缩一次
+    HISTORY_LIMIT: int = 30
+    # is_running检查结果的缓存有效期（秒）
+    RUNNING_CACHE_TTL: float = 0.5
+    # 从文件末尾反向读取日志时的块大小（字节）
+    TAIL_BLOCK_SIZE: int = 8192
+    # 任务信息变更写入状态文件的最小间隔（秒），间隔内的多次变更合并为一次写入
+    STATUS_FLUSH_INTERVAL: float = 0.5
+
+    # 定时任务索引与schedule.jobs一样在进程内共享，任意实例登记的任务都能被其他实例查找和取消
+    # 按job_id索引的定时任务
+    _jobs_by_id: ClassVar[Dict[str, schedule.Job]] = {}
+    # 按id(job)索引的任务类型，主循环中用字典查找代替属性查找
+    _task_type_by_job: ClassVar[Dict[int, str]] = {}
+    # 各任务类型的日志处理器：(任务日志目录, latest.log和按时间命名的历史日志的处理器ID)
+    # loguru的处理器在进程内全局生效，登记表同样在进程内共享，避免每个实例重复注册导致日志重复写入
+    _task_sinks: ClassVar[Dict[str, Tuple[Path, List[int]]]] = {}
+
     project_dir: Path
     logs_dir: Path
     tasks_dir: Path
@@ -74,6 +141,106 @@ class SchedulerDaemon:
         (self.tasks_dir / "cleanup").mkdir(exist_ok=True)
 
         self.running = False
+        # 停止信号到达时唤醒主循环的休眠
+        self._stop_event = threading.Event()
+        # 内存中的状态，首次更新时从文件加载一次，之后只写不读
+        self._status_cache: Optional[Dict[str, Any]] = None
+        # 内存状态是否有尚未写入文件的变更，以及上次写入的时间
+        self._status_dirty = False
+        self._status_last_flush = 0.0
+        # 各任务类型的历史记录，首次更新时从文件加载，超出上限的旧记录自动淘汰
+        self._history_cache: Dict[str, deque] = {}
+        # 各任务类型历史文件当前的行数
+        self._history_lines: Dict[str, int] = {}
+        # (是否运行, 检查时间)，短时间内重复检查直接复用结果
+        self._running_cache: Optional[Tuple[bool, float]] = None
+        # 最近一次从PID文件读取的进程ID
+        self._pid: Optional[int] = None
+
+    @classmethod
+    def register_job(cls, job_id: str, task_type: str, job: schedule.Job) -> None:
+        """
+        登记定时任务，设置任务ID和类型并加入索引
+
+        Args:
+            job_id: 任务ID
+            task_type: 任务类型
+            job: schedule任务对象
+        """
+        job.job_id = job_id
+        job.task_type = task_type
+        cls._jobs_by_id[job_id] = job
+        cls._task_type_by_job[id(job)] = task_type
+
+    @classmethod
+    def find_job(cls, job_id: str) -> Optional[schedule.Job]:
+        """
+        按任务ID查找定时任务，索引未命中时在schedule.jobs中查找并补入索引
+
+        Args:
+            job_id: 任务ID
+
+        Returns:
+            Optional[schedule.Job]: 任务对象，不存在时返回None
+        """
+        job = cls._jobs_by_id.get(job_id)
+        if job is not None:
+            return job
+
+        # 未经register_job登记的任务（如直接设置job_id的任务）只能逐个查找
+        for job in schedule.jobs:
+            if getattr(job, "job_id", None) == job_id:
+                cls._jobs_by_id[job_id] = job
+                task_type = getattr(job, "task_type", None)
+                if task_type:
+                    cls._task_type_by_job[id(job)] = task_type
+                return job
+        return None
+
+    @classmethod
+    def unregister_job(cls, job_id: str) -> Optional[schedule.Job]:
+        """
+        从索引中移除定时任务
+
+        Args:
+            job_id: 任务ID
+
+        Returns:
+            Optional[schedule.Job]: 被移除的任务对象，不存在时返回None
+        """
+        job = cls.find_job(job_id)
+        if job is not None:
+            cls._jobs_by_id.pop(job_id, None)
+            cls._task_type_by_job.pop(id(job), None)
+        return job
+
+    def _load_status(self) -> Dict[str, Any]:
+        """
+        获取内存中的调度器状态，首次调用时从状态文件加载
+
+        Returns:
+            Dict[str, Any]: 调度器状态
+        """
+        if self._status_cache is None:
+            self._status_cache = {}
+            try:
+                self._status_cache = _json_loads(self.status_file.read_bytes())
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"读取调度器状态文件失败，将重新生成: {e}")
+        return self._status_cache
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """
+        原子写入JSON文件，避免读取方看到写了一半的内容
+
+        Args:
+            path: 目标文件路径
+            data: 要写入的数据
+        """
+        atomic_write_bytes(path, _json_dumps(data))
 
     def _update_status(self, status: Optional[str] = None, task_info: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -87,19 +254,17 @@ class SchedulerDaemon:
             Exception: 更新状态失败时抛出
         """
         try:
-            # 读取当前状态
-            current_status = {}
-            if self.status_file.exists():
-                with open(self.status_file, "r", encoding="utf-8") as f:
-                    current_status = json.load(f)
+            # 直接修改内存中的状态，无需每次重新读取文件
+            current_status = self._load_status()
 
             # 更新状态
             if status:
                 current_status["status"] = status
+                now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 if status == "running":
-                    current_status["start_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    current_status["start_time"] = now_str
                 elif status == "stopped":
-                    current_status["stop_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    current_status["stop_time"] = now_str
 
             # 更新任务信息
             if task_info:
@@ -110,16 +275,35 @@ class SchedulerDaemon:
                         current_status["tasks"][task_type] = {}
                     current_status["tasks"][task_type].update(info)
 
-            # 写入状态文件
-            with open(self.status_file, "w", encoding="utf-8") as f:
-                json.dump(current_status, f, indent=2, ensure_ascii=False)
+            # 调度器状态切换立即写入，任务信息变更按间隔合并写入
+            self._status_dirty = True
+            if status:
+                self._flush_status()
+            else:
+                self._flush_status_if_needed()
 
         except Exception as e:
             logger.error(f"更新调度器状态失败: {e}")
 
+    def _flush_status(self) -> None:
+        """将内存中尚未写入的状态写入状态文件"""
+        if not self._status_dirty:
+            return
+        try:
+            self._write_json(self.status_file, self._status_cache)
+            self._status_dirty = False
+            self._status_last_flush = time.monotonic()
+        except Exception as e:
+            logger.error(f"写入调度器状态失败: {e}")
+
+    def _flush_status_if_needed(self) -> None:
+        """距上次写入超过STATUS_FLUSH_INTERVAL时才写入状态文件"""
+        if self._status_dirty and time.monotonic() - self._status_last_flush >= self.STATUS_FLUSH_INTERVAL:
+            self._flush_status()
+
     def _get_task_logger(self, task_type: str) -> logger:
         """
-        获取任务专用的日志记录器
+        获取任务专用的日志记录器，日志处理器每种任务只注册一次
 
         Args:
             task_type: 任务类型
@@ -128,17 +312,49 @@ class SchedulerDaemon:
             logger: 日志记录器
         """
         task_dir = self.tasks_dir / task_type
-        latest_log = task_dir / "latest.log"
-        history_log = task_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-        # 创建新的日志记录器
-        task_logger = logger.bind(task=task_type)
+        registered = self._task_sinks.get(task_type)
+        if registered is None or registered[0] != task_dir:
+            # 同类型任务的日志目录发生变化时，先移除旧的处理器再注册新的
+            if registered is not None:
+                for sink_id in registered[1]:
+                    try:
+                        logger.remove(sink_id)
+                    except ValueError:
+                        # 处理器已在别处被移除
+                        pass
+
+            task_filter = self._task_filter(task_type)
+            self._task_sinks[task_type] = (task_dir, [
+                logger.add(
+                    str(task_dir / "latest.log"),
+                    rotation="1 day",
+                    retention="7 days",
+                    filter=task_filter,
+                ),
+                # 历史日志文件名由loguru按首次写入时间生成，轮转时自动创建新文件
+                logger.add(
+                    str(task_dir / "{time:YYYYMMDD_HHmmss}.log"),
+                    rotation="1 day",
+                    retention="30 days",
+                    delay=True,
+                    filter=task_filter,
+                ),
+            ])
+
+        return logger.bind(task=task_type)
+
+    @staticmethod
+    def _task_filter(task_type: str) -> Callable[[Dict[str, Any]], bool]:
+        """
+        生成只接收指定任务日志的过滤器
 
-        # 添加日志处理器
-        task_logger.add(str(latest_log), rotation="1 day", retention="7 days")
-        task_logger.add(str(history_log), retention="30 days")
+        Args:
+            task_type: 任务类型
 
-        return task_logger
+        Returns:
+            Callable[[Dict[str, Any]], bool]: loguru日志过滤函数
+        """
+        return lambda record: record["extra"].get("task") == task_type
 
     def _update_task_history(self, task_type: str, status: str, error: str = None) -> None:
         """
@@ -150,36 +366,31 @@ class SchedulerDaemon:
             error: 错误信息（如果有）
         """
         try:
-            history_file = self.tasks_dir / task_type / "history.json"
-            history = []
-
-            # 读取现有历史记录
-            if history_file.exists():
-                with open(history_file, "r", encoding="utf-8") as f:
-                    history = json.load(f)
-
-            # 添加新记录
-            history.append(
-                {
-                    "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "status": status,
-                    "error": error,
-                }
-            )
-
-            # 只保留最近30条记录
-            if len(history) > 30:
-                history = history[-30:]
-
-            # 保存历史记录
-            with open(history_file, "w", encoding="utf-8") as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            history_file = self.tasks_dir / task_type / "history.ndjson"
+            # 历史记录和状态中的执行时间使用同一个时间戳
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            # 读取现有历史记录，每种任务只读取一次
+            history = self._history_cache.get(task_type)
+            if history is None:
+                history = self._load_task_history(task_type, history_file)
+
+            # 添加新记录，内存中只保留最近HISTORY_LIMIT条
+            record = {"time": now_str, "status": status, "error": error}
+            history.append(record)
+
+            # 追加写入一行，行数过多时再用内存中的最近记录重写文件
+            with open(history_file, "ab") as f:
+                f.write(_json_dumps(record) + b"\n")
+            self._history_lines[task_type] += 1
+            if self._history_lines[task_type] >= 2 * self.HISTORY_LIMIT:
+                self._compact_task_history(task_type, history_file)
 
             # 更新调度器状态
             self._update_status(
                 task_info={
                     task_type: {
-                        "last_run": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "last_run": now_str,
                         "status": status,
                         "last_error": error,
                     }
@@ -189,6 +400,47 @@ class SchedulerDaemon:
         except Exception as e:
             logger.error(f"更新任务历史失败: {e}")
 
+    def _load_task_history(self, task_type: str, history_file: Path) -> deque:
+        """
+        从NDJSON历史文件加载最近的记录，兼容旧版history.json
+
+        Args:
+            task_type: 任务类型
+            history_file: NDJSON历史文件路径
+
+        Returns:
+            deque: 最近HISTORY_LIMIT条历史记录
+        """
+        records: List[Dict[str, Any]] = []
+        if history_file.exists():
+            records = [_json_loads(line) for line in history_file.read_bytes().splitlines() if line.strip()]
+            self._history_lines[task_type] = len(records)
+        else:
+            self._history_lines[task_type] = 0
+            legacy_file = history_file.with_suffix(".json")
+            if legacy_file.exists():
+                records = _json_loads(legacy_file.read_bytes())
+
+        history = deque(records, maxlen=self.HISTORY_LIMIT)
+        self._history_cache[task_type] = history
+
+        # 旧版文件的记录迁移到新文件
+        if records and not history_file.exists():
+            self._compact_task_history(task_type, history_file)
+        return history
+
+    def _compact_task_history(self, task_type: str, history_file: Path) -> None:
+        """
+        用内存中的最近记录原子重写历史文件
+
+        Args:
+            task_type: 任务类型
+            history_file: NDJSON历史文件路径
+        """
+        history = self._history_cache[task_type]
+        atomic_write_bytes(history_file, b"".join(_json_dumps(record) + b"\n" for record in history))
+        self._history_lines[task_type] = len(history)
+
     def _run_task_with_logging(self, task_type: str, task_func: Callable[[], Any]) -> None:
         """
         执行任务并记录日志
@@ -201,26 +453,29 @@ class SchedulerDaemon:
             Exception: 任务执行失败时抛出
         """
         task_logger = self._get_task_logger(task_type)
-        try:
-            task_logger.info(f"开始执行{task_type}任务")
-            start_time = time.time()
 
-            # 执行任务
-            task_func()
+        # 任务函数内部通过全局logger输出的日志也归入该任务
+        with logger.contextualize(task=task_type):
+            try:
+                task_logger.info(f"开始执行{task_type}任务")
+                start_time = time.time()
 
-            # 记录成功
-            duration = time.time() - start_time
-            task_logger.success(f"{task_type}任务执行成功，耗时: {duration:.2f}秒")
-            self._update_task_history(task_type, "success")
+                # 执行任务
+                task_func()
 
-        except Exception as e:
-            # 记录失败
-            error_msg = str(e)
-            task_logger.error(f"{task_type}任务执行失败: {error_msg}")
-            self._update_task_history(task_type, "failed", error_msg)
+                # 记录成功
+                duration = time.time() - start_time
+                task_logger.success(f"{task_type}任务执行成功，耗时: {duration:.2f}秒")
+                self._update_task_history(task_type, "success")
 
-            # 记录详细的异常信息
-            task_logger.error(f"异常详情: {traceback.format_exc()}")
+            except Exception as e:
+                # 记录失败
+                error_msg = str(e)
+                task_logger.error(f"{task_type}任务执行失败: {error_msg}")
+                self._update_task_history(task_type, "failed", error_msg)
+
+                # 记录详细的异常信息
+                task_logger.error(f"异常详情: {traceback.format_exc()}")
 
     def start(self) -> bool:
         """
@@ -239,6 +494,7 @@ class SchedulerDaemon:
 
             def handle_signal(signum, frame):
                 self.running = False
+                self._stop_event.set()
 
             # 设置信号处理
             signal.signal(signal.SIGTERM, handle_signal)
@@ -255,6 +511,7 @@ class SchedulerDaemon:
                 # 记录PID
                 with open(self.pid_file, "w") as f:
                     f.write(str(os.getpid()))
+                self._running_cache = None
 
                 # 设置日志
                 logger.add(str(self.log_file), rotation="1 day", retention="30 days")
@@ -264,38 +521,23 @@ class SchedulerDaemon:
 
                 # 运行调度器
                 self.running = True
+                self._stop_event.clear()
                 while self.running:
                     try:
-                        # 获取待执行的任务
-                        jobs = schedule.jobs
-                        for job in jobs:
-                            # 如果任务应该执行
-                            if job.should_run:
-                                # 获取任务类型
-                                task_type = getattr(job, "task_type", None)
-                                if task_type:
-                                    # 包装任务函数
-                                    original_func = job.job_func
-                                    self._run_task_with_logging(task_type, original_func)
-
-                                # 运行任务
-                                job.run()
-
-                                # 更新下次执行时间
-                                if task_type:
-                                    next_run = (
-                                        job.next_run.strftime("%Y-%m-%d %H:%M:%S")
-                                        if job.next_run
-                                        else None
-                                    )
-                                    self._update_status(
-                                        task_info={task_type: {"next_run": next_run}}
-                                    )
-
+                        self._run_pending_jobs()
                     except Exception as e:
                         logger.error(f"调度器执行出错: {e}")
 
-                    time.sleep(1)
+                    # 休眠前写入本轮合并的状态变更
+                    self._flush_status()
+
+                    # 休眠到下一个任务到期，收到停止信号时立即唤醒
+                    delay = schedule.idle_seconds()
+                    if delay is None:
+                        delay = self.MAX_IDLE_SECONDS
+                    self._stop_event.wait(
+                        min(max(delay, self.MIN_IDLE_SECONDS), self.MAX_IDLE_SECONDS)
+                    )
 
                 logger.info("调度器守护进程已停止")
                 self._update_status("stopped")
@@ -306,6 +548,29 @@ class SchedulerDaemon:
             logger.error(f"启动调度器守护进程失败: {e}")
             return False
 
+    def _run_pending_jobs(self) -> None:
+        """执行所有已到期的任务，带任务类型的任务记录日志并更新下次执行时间"""
+        task_type_by_job = self._task_type_by_job
+        for job in sorted(job for job in schedule.jobs if job.should_run):
+            task_type = task_type_by_job.get(id(job)) or getattr(job, "task_type", None)
+            if not task_type:
+                try:
+                    job.run()
+                except Exception as e:
+                    logger.error(f"执行定时任务失败: {e}")
+                    # job.run()只在任务函数正常返回时计算下次执行时间，失败时手动重新调度
+                    job._schedule_next_run()
+                continue
+
+            # job.run()执行任务函数并计算下次执行时间，任务只执行一次
+            self._run_task_with_logging(task_type, job.run)
+            if job.should_run:
+                # 任务失败时job.run()未重新调度，手动计算下次执行时间，避免反复重试
+                job._schedule_next_run()
+
+            next_run = job.next_run.strftime("%Y-%m-%d %H:%M:%S") if job.next_run else None
+            self._update_status(task_info={task_type: {"next_run": next_run}})
+
     def stop(self) -> bool:
         """
         停止调度器守护进程
@@ -318,12 +583,12 @@ class SchedulerDaemon:
                 logger.warning("调度器未在运行")
                 return True
 
-            # 读取PID
-            with open(self.pid_file, "r") as f:
-                pid = int(f.read().strip())
+            # is_running已读取过PID
+            pid = self._pid
 
             # 发送终止信号
             os.kill(pid, signal.SIGTERM)
+            self._running_cache = None
 
             # 等待进程结束
             max_wait = 10
@@ -339,6 +604,8 @@ class SchedulerDaemon:
             # 删除PID文件
             if self.pid_file.exists():
                 self.pid_file.unlink()
+            self._running_cache = None
+            self._pid = None
 
             logger.success("调度器已停止")
             return True
@@ -354,15 +621,34 @@ class SchedulerDaemon:
         Returns:
             bool: 是否正在运行
         """
-        if not self.pid_file.exists():
-            return False
+        now = time.monotonic()
+        if self._running_cache and now - self._running_cache[1] < self.RUNNING_CACHE_TTL:
+            return self._running_cache[0]
+
+        running = self._check_running()
+        self._running_cache = (running, now)
+        return running
+
+    def _check_running(self) -> bool:
+        """
+        读取PID文件并检查对应进程是否存在
 
+        Returns:
+            bool: 是否正在运行
+        """
         try:
             with open(self.pid_file, "r") as f:
-                pid = int(f.read().strip())
+                self._pid = int(f.read().strip())
 
-            # 检查进程是否存在
-            os.kill(pid, 0)
+            # Linux下直接检查/proc/<pid>，进程不存在说明PID文件已过期，顺带清理
+            if _HAS_PROC:
+                if (_PROC_DIR / str(self._pid)).exists():
+                    return True
+                self.pid_file.unlink(missing_ok=True)
+                return False
+
+            # 其他平台通过发送空信号检查进程是否存在
+            os.kill(self._pid, 0)
             return True
         except (FileNotFoundError, ValueError, ProcessLookupError):
             return False
@@ -380,9 +666,8 @@ class SchedulerDaemon:
             Exception: 获取状态失败时抛出
         """
         try:
-            if self.status_file.exists():
-                with open(self.status_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+            return _json_loads(self.status_file.read_bytes())
+        except FileNotFoundError:
             return {}
         except Exception as e:
             logger.error(f"获取调度器状态失败: {e}")
@@ -412,13 +697,39 @@ class SchedulerDaemon:
                 return "日志文件不存在"
 
             # 读取最后N行日志
-            output = check_output(["tail", "-n", str(lines), str(log_file)])
-            return output.decode("utf-8")
+            return self._tail(log_file, lines)
 
         except Exception as e:
             logger.error(f"获取日志失败: {e}")
             return f"获取日志失败: {e}"
 
+    def _tail(self, log_file: Path, lines: int) -> str:
+        """
+        从文件末尾反向按块读取，返回最后N行，无需启动tail子进程
+
+        Args:
+            log_file: 日志文件路径
+            lines: 返回的行数
+
+        Returns:
+            str: 最后N行内容
+        """
+        if lines <= 0:
+            return ""
+
+        with open(log_file, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b""
+            # 多读一个换行符，保证第一行完整（末尾换行符不计为一行）
+            while pos > 0 and data.count(b"\n") <= lines:
+                step = min(self.TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+
+        tail_lines = data.splitlines(keepends=True)[-lines:]
+        return b"".join(tail_lines).decode("utf-8", errors="replace")
+
     def restart(self) -> bool:
         """
         重启调度器守护进程
@@ -450,11 +761,7 @@ class SchedulerDaemon:
                 return False
 
             # 查找对应的任务
-            found_job = None
-            for job in schedule.jobs:
-                if getattr(job, "job_id", None) == job_id:
-                    found_job = job
-                    break
+            found_job = self.find_job(job_id)
 
             if not found_job:
                 logger.error(f"未找到ID为 {job_id} 的任务")
@@ -465,6 +772,7 @@ class SchedulerDaemon:
 
             # 执行任务并记录日志
             self._run_task_with_logging(task_type, job_func)
+            self._flush_status()
 
             return True
 
@@ -1,22 +1,66 @@
 """调度任务管理器，负责容器的定时任务管理"""
 
-import json
+import copy
 import os
+import re
 import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union, TypedDict, Literal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union, TypedDict, Literal, TYPE_CHECKING
 
 import schedule
 import typer
 from loguru import logger
 
 from .base_manager import BaseManager
-from .scheduler_daemon import SchedulerDaemon
+from .config_manager import _load_config_cached, _write_config
+from .image import parse_image_name
 from .image_manager import ImageManager
+from .scheduler_daemon import SchedulerDaemon
 from ..constants import ERROR_MESSAGES
 
+if TYPE_CHECKING:
+    from .container_manager import ContainerManager
+
+# 向后兼容的字符串定时配置格式：HH:MM或HH:MM:SS
+_TIME_RE = re.compile(r"^([0-1]?[0-9]|2[0-3]):([0-5][0-9])(:([0-5][0-9]))?$")
+
+
+def _run_on_month_day(day: int, job_func: Callable[[], Any]) -> Any:
+    """
+    每月任务的执行入口，只在每月指定日期执行任务
+
+    schedule库不直接支持每月执行，任务按天调度，由此函数跳过其余日期。
+
+    Args:
+        day: 每月执行的日期
+        job_func: 要执行的任务函数
+
+    Returns:
+        Any: 任务函数的返回值，非指定日期时返回None
+    """
+    if datetime.now().day == day:
+        return job_func()
+    return None
+
+
+@lru_cache(maxsize=4)
+def _parse_start_time(start_time: str) -> datetime:
+    """
+    解析调度器启动时间，同一启动时间只解析一次
+
+    Args:
+        start_time: "%Y-%m-%d %H:%M:%S"格式的启动时间
+
+    Returns:
+        datetime: 启动时间
+    """
+    # fromisoformat接受空格分隔的日期时间，比strptime快得多
+    return datetime.fromisoformat(start_time)
+
 
 class ScheduleConfig(TypedDict, total=False):
     """定时任务配置类型"""
@@ -27,6 +71,52 @@ class ScheduleConfig(TypedDict, total=False):
     minute: int
 
 
+def _load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    读取项目配置文件，文件未变化时复用已解析的结果
+
+    Args:
+        config_path: 配置文件路径
+
+    Returns:
+        Dict[str, Any]: 配置内容的副本，文件不存在时返回空字典
+    """
+    config_path = os.path.realpath(config_path)
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        return {}
+    # 缓存中的配置为共享对象，深拷贝后再交给调用方修改
+    return copy.deepcopy(_load_config_cached(config_path, st.st_mtime_ns, st.st_size))
+
+
+def _password_env_var(username: Optional[str]) -> str:
+    """
+    获取仓库密码对应的环境变量名
+
+    Args:
+        username: 仓库用户名
+
+    Returns:
+        str: 有用户名时为DOCKER_PASSWORD_<USERNAME>，否则为DOCKER_PASSWORD
+    """
+    return f"DOCKER_PASSWORD_{username.upper()}" if username else "DOCKER_PASSWORD"
+
+
+@lru_cache(maxsize=32)
+def _get_docker_password(username: Optional[str]) -> Optional[str]:
+    """
+    从环境变量读取仓库密码，结果在进程内缓存
+
+    Args:
+        username: 仓库用户名
+
+    Returns:
+        Optional[str]: 环境变量中的密码，未设置时返回None
+    """
+    return os.environ.get(_password_env_var(username))
+
+
 class SchedulerManager(BaseManager):
     """调度任务管理器类，用于管理容器相关的定时任务"""
     
@@ -46,6 +136,68 @@ class SchedulerManager(BaseManager):
         self.project_dir = Path(project_dir)
         self.scheduler_daemon = SchedulerDaemon(project_dir)
         self.container_name = container_name
+        self._config_path = self.project_dir / "config.json"
+        # 当前配置事务中的配置，事务外为None
+        self._config_txn: Optional[Dict[str, Any]] = None
+
+    @cached_property
+    def _container_manager(self) -> "ContainerManager":
+        """定时任务使用的容器管理器，首次使用时创建，之后各次任务执行复用同一实例"""
+        # container_manager在模块顶层导入本模块，这里必须延迟导入以避免循环依赖
+        from .container_manager import ContainerManager
+
+        return ContainerManager(str(self.project_dir), self.container_name)
+
+    @cached_property
+    def _image_manager(self) -> ImageManager:
+        """定时任务使用的镜像管理器，首次使用时创建，之后各次任务执行复用同一实例"""
+        return ImageManager(str(self.project_dir))
+
+    @classmethod
+    def _cancel_job(cls, job_id: Optional[str]) -> bool:
+        """
+        从共享索引中移除并取消定时任务
+
+        Args:
+            job_id: 任务ID
+
+        Returns:
+            bool: 是否找到并取消了任务
+        """
+        if not job_id:
+            return False
+        # 任务索引由SchedulerDaemon在进程内共享，各实例登记的任务都能在这里取消
+        job = SchedulerDaemon.find_job(job_id)
+        if job is None:
+            return False
+        SchedulerDaemon.unregister_job(job_id)
+        schedule.cancel_job(job)
+        return True
+
+    @contextmanager
+    def config_transaction(self) -> Iterator[Dict[str, Any]]:
+        """
+        配置事务，事务内的多次修改只读取和写入配置文件一次
+
+        嵌套使用时复用外层事务的配置，由最外层事务在退出时统一写入；
+        配置未发生变化或事务内抛出异常时不写入。
+
+        Yields:
+            Dict[str, Any]: 可直接修改的项目配置
+        """
+        if self._config_txn is not None:
+            yield self._config_txn
+            return
+
+        config = _load_config(self._config_path)
+        original = copy.deepcopy(config)
+        self._config_txn = config
+        try:
+            yield config
+            if config != original:
+                _write_config(self._config_path, config)
+        finally:
+            self._config_txn = None
 
     def schedule_backup(
         self,
@@ -66,47 +218,52 @@ class SchedulerManager(BaseManager):
         Returns:
             str: 成功返回job_id，失败返回False
         """
-        # 验证推送配置
+        # 验证推送配置，仓库信息在设置任务时读取一次，任务执行时直接使用
+        registry_config = (None, None, None, None)
         if auto_push:
             # 从配置文件中获取镜像仓库信息
-            config_path = os.path.join(self.project_dir, "config.json")
             registry = None
             username = None
             password = None
-
-            if os.path.exists(config_path):
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    if "image" in config and "registry" in config["image"]:
-                        registry = config["image"]["registry"].get("url")
-                        username = config["image"]["registry"].get("username")
-                        prefix = config["image"]["registry"].get("prefix")
-                        # 优先从环境变量获取密码
-                        env_var_name = (
-                            f"DOCKER_PASSWORD_{username.upper()}" if username else "DOCKER_PASSWORD"
-                        )
-                        password = os.environ.get(env_var_name) or config["image"]["registry"].get(
-                            "password"
-                        )
+            prefix = None
+
+            config = _load_config(self._config_path)
+            if "image" in config and "registry" in config["image"]:
+                registry = config["image"]["registry"].get("url")
+                username = config["image"]["registry"].get("username")
+                prefix = config["image"]["registry"].get("prefix")
+                # 优先从环境变量获取密码
+                password = _get_docker_password(username) or config["image"]["registry"].get(
+                    "password"
+                )
 
             # 验证推送配置是否完整
             if not registry or not username or not password:
-                logger.warning("启用自动推送但仓库配置不完整")
-                logger.warning("请确保在配置文件中设置了 registry.url 和 registry.username")
-                logger.warning("密码可以通过环境变量设置，避免明文存储")
+                # 合并为一条日志输出，只获取一次日志锁
                 logger.warning(
-                    f"可以设置环境变量 {env_var_name if username else 'DOCKER_PASSWORD'} 来提供密码"
+                    "\n".join(
+                        [
+                            "启用自动推送但仓库配置不完整",
+                            "请确保在配置文件中设置了 registry.url 和 registry.username",
+                            "密码可以通过环境变量设置，避免明文存储",
+                            f"可以设置环境变量 {_password_env_var(username)} 来提供密码",
+                            "继续设置定时备份任务，但自动推送可能会失败",
+                        ]
+                    )
                 )
-                logger.warning("继续设置定时备份任务，但自动推送可能会失败")
-                
+
+            registry_config = (registry, username, password, prefix)
+
+        # 备份镜像的仓库名和标签在设置任务时解析一次，只有最后一个"/"之后的冒号才是标签分隔符
+        backup_repository, backup_tag = image_name, None
+        if image_name and ":" in image_name.rpartition("/")[2]:
+            backup_repository, backup_tag = parse_image_name(image_name)
+
         # 定义备份作业函数
         def backup_job():
-            # 导入这里以避免循环依赖
-            from .container_manager import ContainerManager
-            
             try:
-                # 创建ContainerManager实例
-                container_manager = ContainerManager(str(self.project_dir), self.container_name)
+                # 复用容器管理器，避免每次执行都重新连接Docker
+                container_manager = self._container_manager
                 
                 # 如果需要清理，先清理容器
                 if cleanup:
@@ -114,12 +271,9 @@ class SchedulerManager(BaseManager):
                     container_manager.cleanup_container()
                 
                 # 保存镜像
-                # 导入ImageManager执行备份
-                image_manager = ImageManager(str(self.project_dir))
+                image_manager = self._image_manager
                 saved_image = image_manager.create_from_container(
-                    self.container_name, 
-                    tag=None if not image_name else image_name.split(":")[-1] if ":" in image_name else None,
-                    repository=None if not image_name else image_name.split(":")[0] if ":" in image_name else image_name
+                    self.container_name, tag=backup_tag, repository=backup_repository
                 )
                 
                 if not saved_image:
@@ -129,30 +283,8 @@ class SchedulerManager(BaseManager):
                 # 自动推送
                 if auto_push and saved_image:
                     try:
-                        # 从配置文件中获取镜像仓库信息
-                        config_path = os.path.join(self.project_dir, "config.json")
-                        registry = None
-                        username = None
-                        password = None
-                        prefix = None
-
-                        if os.path.exists(config_path):
-                            with open(config_path, "r", encoding="utf-8") as f:
-                                config = json.load(f)
-                                if "image" in config and "registry" in config["image"]:
-                                    registry = config["image"]["registry"].get("url")
-                                    username = config["image"]["registry"].get("username")
-                                    prefix = config["image"]["registry"].get("prefix")
-                                    # 优先从环境变量获取密码
-                                    env_var_name = (
-                                        f"DOCKER_PASSWORD_{username.upper()}"
-                                        if username
-                                        else "DOCKER_PASSWORD"
-                                    )
-                                    password = os.environ.get(env_var_name) or config["image"][
-                                        "registry"
-                                    ].get("password")
-                        
+                        registry, username, password, prefix = registry_config
+
                         # 推送镜像
                         if image_manager.push_image(registry, username, password, prefix=prefix, use_existing_tags=True):
                             logger.success(f"备份镜像 {saved_image} 推送成功")
@@ -194,13 +326,9 @@ class SchedulerManager(BaseManager):
             paths = ["/tmp/*", "/var/cache/*"]
 
         def cleanup_job():
-            # 导入这里以避免循环依赖
-            from .container_manager import ContainerManager
-            
             try:
-                # 创建ContainerManager实例清理容器
-                container_manager = ContainerManager(str(self.project_dir), self.container_name)
-                container_manager.cleanup_container(paths)
+                # 复用容器管理器清理容器
+                self._container_manager.cleanup_container(paths)
             except Exception as e:
                 logger.error(f"执行清理任务失败: {e}")
 
@@ -237,79 +365,65 @@ class SchedulerManager(BaseManager):
             Optional[schedule.Job]: 成功返回任务对象，失败返回None
         """
         try:
-            # 检查是否存在同类型的旧任务，如果存在则先删除
-            tasks = self.list_scheduled_tasks()
-            if task_type in tasks:
-                logger.info(f"检测到已存在的 {task_type} 任务，正在删除...")
-                # 从schedule库中移除任务
-                job_id = tasks[task_type].get("job_id")
-                if job_id:
-                    for job in schedule.jobs:
-                        if getattr(job, "job_id", None) == job_id:
-                            schedule.cancel_job(job)
-                            break
-                logger.info(f"已删除旧的 {task_type} 任务")
-
-            # 解析定时配置并设置定时任务
-            job = None
-
-            # 向后兼容：如果是字符串，假设是时间格式 (HH:MM)
-            if isinstance(schedule_config, str):
-                # 验证时间格式
-                import re
-
-                if re.match(
-                    r"^([0-1]?[0-9]|2[0-3]):([0-5][0-9])(:([0-5][0-9]))?$", schedule_config
-                ):
-                    job = schedule.every().day.at(schedule_config).do(job_func)
+            # 查找旧任务和保存新任务在同一个配置事务中完成，配置文件只读写一次
+            with self.config_transaction() as config:
+                # 检查是否存在同类型的旧任务，如果存在则先删除
+                tasks = config.get("schedule", {})
+                if task_type in tasks:
+                    logger.info(f"检测到已存在的 {task_type} 任务，正在删除...")
+                    # 从schedule库中移除任务
+                    self._cancel_job(tasks[task_type].get("job_id"))
+                    logger.info(f"已删除旧的 {task_type} 任务")
+
+                # 解析定时配置并设置定时任务
+                job = None
+
+                # 向后兼容：如果是字符串，假设是时间格式 (HH:MM)
+                if isinstance(schedule_config, str):
+                    # 验证时间格式
+                    if _TIME_RE.match(schedule_config):
+                        job = schedule.every().day.at(schedule_config).do(job_func)
+                    else:
+                        raise ValueError(f"无效的时间格式: {schedule_config}，请使用 HH:MM 格式")
                 else:
-                    raise ValueError(f"无效的时间格式: {schedule_config}，请使用 HH:MM 格式")
-            else:
-                # 新格式：字典配置
-                schedule_type = schedule_config.get("type")
-
-                if schedule_type == "daily":
-                    time = schedule_config.get("time", "00:00")
-                    job = schedule.every().day.at(time).do(job_func)
-
-                elif schedule_type == "weekly":
-                    weekday = schedule_config.get("weekday", "monday")
-                    time = schedule_config.get("time", "00:00")
-                    weekday_method = getattr(schedule.every(), weekday)
-                    job = weekday_method.at(time).do(job_func)
-
-                elif schedule_type == "monthly":
-                    day = schedule_config.get("day", 1)
-                    time = schedule_config.get("time", "00:00")
-                    # schedule库不直接支持每月执行，使用自定义逻辑
-                    job = (
-                        schedule.every()
-                        .day.at(time)
-                        .do(lambda: job_func() if datetime.now().day == day else None)
-                    )
+                    # 新格式：字典配置
+                    schedule_type = schedule_config.get("type")
 
-                elif schedule_type == "hourly":
-                    minute = schedule_config.get("minute", 0)
-                    job = schedule.every().hour.at(f":{minute:02d}").do(job_func)
+                    if schedule_type == "daily":
+                        time = schedule_config.get("time", "00:00")
+                        job = schedule.every().day.at(time).do(job_func)
 
-                else:
-                    raise ValueError(f"不支持的定时类型: {schedule_type}")
+                    elif schedule_type == "weekly":
+                        weekday = schedule_config.get("weekday", "monday")
+                        time = schedule_config.get("time", "00:00")
+                        weekday_method = getattr(schedule.every(), weekday)
+                        job = weekday_method.at(time).do(job_func)
+
+                    elif schedule_type == "monthly":
+                        day = schedule_config.get("day", 1)
+                        time = schedule_config.get("time", "00:00")
+                        # schedule库不直接支持每月执行，按天调度并由_run_on_month_day判断日期
+                        job = schedule.every().day.at(time).do(_run_on_month_day, day, job_func)
+
+                    elif schedule_type == "hourly":
+                        minute = schedule_config.get("minute", 0)
+                        job = schedule.every().hour.at(f":{minute:02d}").do(job_func)
 
-            if not job:
-                raise ValueError(f"无法设置定时任务: {schedule_config}")
+                    else:
+                        raise ValueError(f"不支持的定时类型: {schedule_type}")
 
-            # 生成新的任务ID
-            job_id = f"{task_type}_{uuid.uuid4().hex[:8]}"
-            setattr(job, "job_id", job_id)
+                if not job:
+                    raise ValueError(f"无法设置定时任务: {schedule_config}")
 
-            # 设置任务类型属性，用于日志记录
-            setattr(job, "task_type", task_type)
+                # 生成新的任务ID，登记任务ID和任务类型（用于日志记录）
+                job_id = f"{task_type}_{uuid.uuid4().hex[:8]}"
+                SchedulerDaemon.register_job(job_id, task_type, job)
 
-            # 保存任务信息到配置文件
-            self._save_schedule_info(task_type, str(schedule_config), job_id, extra_info)
+                # 保存任务信息到配置文件
+                self._save_schedule_info(task_type, str(schedule_config), job_id, extra_info)
 
-            logger.success(f"已设置定时{task_type}任务: {schedule_config}")
-            return job
+                logger.success(f"已设置定时{task_type}任务: {schedule_config}")
+                return job
 
         except Exception as e:
             logger.error(f"设置定时{task_type}任务失败: {e}")
@@ -336,29 +450,19 @@ class SchedulerManager(BaseManager):
             if not job_id:
                 job_id = f"{task_type}_{uuid.uuid4().hex[:8]}"
 
-            # 获取项目配置
-            config_path = os.path.join(self.project_dir, "config.json")
-            if os.path.exists(config_path):
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-            else:
-                config = {}
-
-            # 确保配置中有schedule部分
-            if "schedule" not in config:
-                config["schedule"] = {}
-
-            # 保存任务信息
-            config["schedule"][task_type] = {
-                "cron": cron_expr,
-                "job_id": job_id,
-                "container_name": self.container_name,
-                **(extra_info or {}),
-            }
+            # 在配置事务中保存任务信息，退出事务时写入配置文件
+            with self.config_transaction() as config:
+                # 确保配置中有schedule部分
+                if "schedule" not in config:
+                    config["schedule"] = {}
 
-            # 写入配置文件
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+                # 保存任务信息
+                config["schedule"][task_type] = {
+                    "cron": cron_expr,
+                    "job_id": job_id,
+                    "container_name": self.container_name,
+                    **(extra_info or {}),
+                }
 
         except Exception as e:
             logger.error(f"保存定时任务信息失败: {e}")
@@ -371,15 +475,11 @@ class SchedulerManager(BaseManager):
             Dict[str, Any]: 任务信息字典
         """
         try:
-            config_path = os.path.join(self.project_dir, "config.json")
-            if os.path.exists(config_path):
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-
-                if "schedule" in config:
-                    return config["schedule"]
-
-            return {}
+            # 事务中直接读取事务内的配置，反映尚未写入的修改
+            config = self._config_txn
+            if config is None:
+                config = _load_config(self._config_path)
+            return config.get("schedule", {})
 
         except Exception as e:
             logger.error(f"获取定时任务列表失败: {e}")
@@ -396,33 +496,18 @@ class SchedulerManager(BaseManager):
             bool: 是否成功删除
         """
         try:
-            # 获取任务信息
-            tasks = self.list_scheduled_tasks()
-            if task_type not in tasks:
-                logger.warning(f"未找到类型为 {task_type} 的定时任务")
-                return False
-
-            # 从schedule库中移除任务
-            job_id = tasks[task_type].get("job_id")
-            if job_id:
-                # 查找并移除对应的任务
-                for job in schedule.jobs:
-                    if getattr(job, "job_id", None) == job_id:
-                        schedule.cancel_job(job)
-                        break
-
-            # 从配置中移除任务信息
-            config_path = os.path.join(self.project_dir, "config.json")
-            if os.path.exists(config_path):
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-
-                if "schedule" in config and task_type in config["schedule"]:
-                    del config["schedule"][task_type]
-
-                    # 写回配置文件
-                    with open(config_path, "w", encoding="utf-8") as f:
-                        json.dump(config, f, indent=2, ensure_ascii=False)
+            # 查找和删除在同一个配置事务中完成，配置文件只读写一次
+            with self.config_transaction() as config:
+                tasks = config.get("schedule", {})
+                if task_type not in tasks:
+                    logger.warning(f"未找到类型为 {task_type} 的定时任务")
+                    return False
+
+                # 从schedule库中移除任务
+                self._cancel_job(tasks[task_type].get("job_id"))
+
+                # 从配置中移除任务信息
+                del tasks[task_type]
 
             logger.success(f"已删除 {task_type} 定时任务")
             return True
@@ -481,7 +566,7 @@ class SchedulerManager(BaseManager):
 
         # 计算运行时间
         if status.get("status") == "running" and "start_time" in status:
-            start_time = datetime.strptime(status["start_time"], "%Y-%m-%d %H:%M:%S")
+            start_time = _parse_start_time(status["start_time"])
             now = datetime.now()
             delta = now - start_time
             days = delta.days
@@ -10,4 +10,6 @@ def get_timestamp() -> str:
     Returns:
         格式化的时间戳字符串
     """
-    return datetime.now().strftime("%Y%m%d_%H%M%S") 
\ No newline at end of file
+    # 直接格式化各字段，避免strftime逐字符解析格式串
+    n = datetime.now()
+    return f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}" 
\ No newline at end of file
@@ -3,6 +3,7 @@
 import os
 import re
 import shlex
+import stat
 import subprocess
 import sys
 import tempfile
@@ -19,7 +20,9 @@ if TYPE_CHECKING:
     from .managers.project_manager import ProjectManager
 
 
-def run_command(command: str, shell: bool = False, check: bool = True) -> Tuple[int, str, str]:
+def run_command(
+    command: str, shell: bool = False, check: bool = True, stream: bool = False
+) -> Tuple[int, str, str]:
     """
     运行shell命令并返回结果
 
@@ -27,36 +30,41 @@ def run_command(command: str, shell: bool = False, check: bool = True) -> Tuple[
         command: 要运行的命令
         shell: 是否使用shell执行
         check: 是否检查返回码
+        stream: 是否逐行输出命令日志，为True时标准错误合并到标准输出
 
     Returns:
         (返回码, 标准输出, 标准错误)
     """
     logger.debug(f"执行命令: {command}")
 
-    if shell:
-        # 使用shell执行命令
-        process = subprocess.Popen(
-            command,
-            shell=True,
+    # 使用shell执行时直接传入命令字符串，否则拆分为参数列表
+    args = command if shell else shlex.split(command)
+
+    if stream:
+        # 逐行读取输出，长时间运行的命令可以实时看到进度
+        lines: List[str] = []
+        with subprocess.Popen(
+            args,
+            shell=shell,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             universal_newlines=True,
-        )
+        ) as process:
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                # 与构建日志一致，使用warning级别输出到控制台
+                logger.warning(line)
+                lines.append(line)
+        return_code = process.returncode
+        stdout, stderr = "\n".join(lines), ""
     else:
-        # 不使用shell执行命令
-        args = shlex.split(command)
-        process = subprocess.Popen(
-            args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
-        )
-
-    # 获取输出
-    stdout, stderr = process.communicate()
-    return_code = process.returncode
+        result = subprocess.run(args, shell=shell, capture_output=True, universal_newlines=True)
+        return_code, stdout, stderr = result.returncode, result.stdout, result.stderr
 
     # 检查返回码
     if check and return_code != 0:
         logger.error(f"命令执行失败: {command}")
-        logger.error(f"错误输出: {stderr}")
+        logger.error(f"错误输出: {stderr or stdout}")
         raise subprocess.CalledProcessError(return_code, command, stdout, stderr)
 
     return return_code, stdout, stderr
@@ -78,6 +86,47 @@ def create_temp_file(content: str) -> str:
     return path
 
 
+def atomic_write_bytes(path: Union[str, "os.PathLike[str]"], data: bytes, new_file_mode: int = 0o644) -> str:
+    """
+    原子写入文件，读取方不会看到写了一半的内容
+
+    先写入同目录下的唯一临时文件并落盘，再替换目标文件，并发写入时不会互相覆盖临时文件，
+    写入失败时删除临时文件。目标文件已存在时沿用其权限，为符号链接时替换其指向的文件。
+
+    Args:
+        path: 目标文件路径
+        data: 要写入的内容
+        new_file_mode: 目标文件不存在时使用的权限
+
+    Returns:
+        str: 实际写入的文件路径（已解析符号链接）
+    """
+    # 解析符号链接，替换链接目标而不是把链接本身换成普通文件
+    path = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = new_file_mode
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return path
+
+
 def check_project_status(project_manager: "ProjectManager", action: str) -> bool:
     """
     检查项目状态是否允许执行指定操作
@@ -143,9 +192,15 @@ def check_project_status(project_manager: "ProjectManager", action: str) -> bool
                 logger.warning("未配置镜像仓库地址，将使用默认仓库 (docker.io)")
 
             if not registry.get("username"):
-                logger.warning("未配置仓库用户名，可能无法推送到私有仓库")
-                logger.warning("Docker Hub要求镜像名称格式为 '用户名/镜像名'")
-                logger.warning("您可以在推送时使用 -u/--username 参数指定用户名")
+                logger.warning(
+                    "\n".join(
+                        [
+                            "未配置仓库用户名，可能无法推送到私有仓库",
+                            "Docker Hub要求镜像名称格式为 '用户名/镜像名'",
+                            "您可以在推送时使用 -u/--username 参数指定用户名",
+                        ]
+                    )
+                )
 
             # 检查镜像名称格式
             image_name = project_manager.image_manager.image_name
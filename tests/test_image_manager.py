@@ -0,0 +1,41 @@
+"""镜像管理器测试"""
+
+from unittest import mock
+
+import docker
+import pytest
+import requests
+
+from dockmaster.managers.image_manager import ImageManager
+
+
+@pytest.fixture
+def docker_client():
+    """替换docker.from_env，返回模拟的Docker客户端"""
+    client = mock.MagicMock()
+    with mock.patch.object(docker, "from_env", return_value=client):
+        yield client
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        docker.errors.APIError("daemon error"),
+        requests.exceptions.ConnectionError("connection refused"),
+    ],
+)
+def test_get_images_summary_returns_empty_summary_when_list_fails(docker_client, tmp_path, error):
+    """查询镜像列表失败时返回空摘要而不是抛出异常"""
+    docker_client.images.list.side_effect = error
+    manager = ImageManager(str(tmp_path), image_name="demo")
+
+    summary = manager.get_images_summary()
+
+    assert summary == {
+        "total_count": 0,
+        "total_size": 0,
+        "actual_disk_usage": 0,
+        "repos": {},
+        "project_images": [],
+        "project_total_size_mb": 0,
+    }